@@ -4,50 +4,46 @@ Shows basic pattern generation and evolution with audio playback.
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 # --- Internal imports, updated for new package layout ---
 from genetic_music.genome.genome import Genome
 from genetic_music.genome.population import evolve_population
-from genetic_music.generator import generate_expressions_mutational
-from genetic_music.backend.backend import Backend
+from genetic_music.backend.backend import get_shared_backend
 from genetic_music.codegen.tidal_codegen import to_tidal
+from genetic_music.tree.flat import structural_stats
 from genetic_music.fitness_evaluation.fitness_evaluation import get_fitness
 
 
 def structural_fitness(genome: Genome) -> float:
     """Simple fitness function based on pattern structure."""
-    tree = genome.pattern_tree
-
-    depth = tree.depth()
-    size = tree.size()
-
-    ops, sounds = set(), set()
-
-    def collect(node):
-        # Track which grammar rules / token types appear.
-        ops.add(node.op)
-        # SAMPLE_STRING leaves encode concrete sample names such as "bd", "sn", etc.
-        # In the PatternTree they appear with module‑qualified op names like
-        # ``control__pattern_string_sample__SAMPLE_STRING`` and a quoted value.
-        if "SAMPLE_STRING" in node.op and node.value:
-            # Strip surrounding quotes for readability when counting unique sounds.
-            sounds.add(node.value.strip('"'))
-        for child in node.children:
-            collect(child)
-
-    # Start from the underlying root node to avoid treating PatternTree itself
-    # as a node in the structural walk.
-    collect(tree.root)
+    # Use the tree's cached flat arrays to compute depth and the number of
+    # distinct grammar rules / token types and sample names (e.g. "bd",
+    # "sn") in a single pass, JIT-compiled when numba is available.
+    depth, _, n_ops, n_sounds = structural_stats(genome.pattern_tree.flat)
 
     # Normalized scores
     depth_score = min(depth / 5, 1.0)
-    variety_score = len(ops) / 10
-    sound_score = len(sounds) / 4
+    variety_score = n_ops / 10
+    sound_score = n_sounds / 4
 
     return 0.4 * depth_score + 0.3 * variety_score + 0.3 * sound_score
 
 
+# Audio-based fitness renders every candidate through the single
+# SuperCollider recorder, so it has to run serially on the main process. The
+# purely structural fitness has no shared state and is mapped over a process
+# pool that stays alive for the whole run. Set USE_AUDIO_FITNESS=false in
+# the environment to use it.
+USE_AUDIO_FITNESS = os.environ.get("USE_AUDIO_FITNESS", "true").lower() == "true"
+
+# Resolved once so the backend receives absolute paths and does not have to
+# re-resolve them on every recording.
+OUTPUT_DIR = Path("data/outputs/minimal_evolution").resolve()
+
+
 def main():
     # -------------------------------------------------------------------------
     # 1. Initialize backend for audio playback and recording
@@ -69,7 +65,9 @@ def main():
         print(f"ERROR: {e}")
         return
 
-    backend = Backend(
+    # Process-wide backend: booted once and reused by everything that renders
+    # in this run.
+    backend = get_shared_backend(
         boot_tidal_path=BOOT_TIDAL,
         orbit=8,  # SuperDirt orbit to render on
         stream=12,  # dedicated Tidal stream (d12)
@@ -78,15 +76,13 @@ def main():
     # -------------------------------------------------------------------------
     # 2. Output directory
     # -------------------------------------------------------------------------
-    output_dir = Path("data/outputs/minimal_evolution")
-    output_dir.mkdir(parents=True, exist_ok=True)
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
     # -------------------------------------------------------------------------
     # 3. Initial population (PatternTree-based genomes)
     # -------------------------------------------------------------------------
     pop_size = 2
-    expressions = generate_expressions_mutational(pop_size)
-    population = [Genome(pattern_tree=expression) for expression in expressions]
+    population = Genome.random_batch(pop_size)
 
     print("\nInitial Population:")
     print("=" * 50)
@@ -101,16 +97,32 @@ def main():
     # 4. Evolution
     # -------------------------------------------------------------------------
 
+    executor = None
+    if USE_AUDIO_FITNESS:
+        # Render every candidate on the backend booted above instead of
+        # booting GHCi/SuperCollider again for each evaluation.
+        fitness_func = partial(get_fitness, backend=backend)
+    else:
+        # Workers are started once instead of once per generation.
+        executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        fitness_func = structural_fitness
+
+    # Fitness is a pure function of the tree: remember scores by structure so
+    # unchanged elites and duplicate offspring are not rendered again.
+    fitness_cache: dict[int, float] = {}
+
     evolved = population
     for _ in range(1):
         evolved = evolve_population(
             population=evolved,
-            fitness_func=get_fitness,
+            fitness_func=fitness_func,
             mutation_rate=1,
             elitism=0,
+            fitness_cache=fitness_cache,
+            executor=executor,
         )
 
-        best = max(evolved, key=lambda g: g.fitness)
+        best = evolved[0]  # evolve_population returns best-first
         print(f"Evolved population size: {len(evolved)}")
         mutated_example = (
             best.mutate(rate=1.0)
@@ -131,9 +143,8 @@ def main():
         pattern = to_tidal(best.pattern_tree)
         print(f"Pattern: {pattern}")
 
-    output_path = output_dir / "best_pattern.wav"
-    abs_output_path = output_path.resolve()
-    print(f"\nRecording best pattern to: {abs_output_path}")
+    output_path = OUTPUT_DIR / "best_pattern.wav"
+    print(f"\nRecording best pattern to: {output_path}")
 
     recorded_path = backend.play_tidal_code(
         rhs_pattern_expr=pattern,
@@ -142,7 +153,6 @@ def main():
         playback_after=False,
     )
 
-    recorded_path = recorded_path.resolve()
     if recorded_path.exists():
         print(
             f"[minimal_evolution_save_wav] Backend reported output at path: {recorded_path}"
@@ -152,6 +162,8 @@ def main():
             f"[minimal_evolution_save_wav] Backend reported no output at path: {recorded_path}"
         )
 
+    if executor is not None:
+        executor.shutdown()
     backend.close()
 
 
@@ -10,17 +10,24 @@ analysis or for inclusion in reports.
 """
 
 import sys
+from contextlib import closing
+from functools import partial
 from pathlib import Path
 import time
 
+import numpy as np
+
 # --- Internal imports, updated for new package layout ---
 from genetic_music.genome.genome import Genome
 from genetic_music.genome.population import evolve_population
-from genetic_music.generator import generate_expressions_mutational
 from genetic_music.codegen.tidal_codegen import to_tidal
-from genetic_music.fitness_evaluation.fitness_evaluation import get_fitness
+from genetic_music.fitness_evaluation.fitness_evaluation import (
+    create_fitness_backend,
+    get_fitness,
+    get_fitness_batch,
+)
 from genetic_music.run_logger import RunLogger
-from genetic_music.checkpoint import save_checkpoint, load_checkpoint
+from genetic_music.checkpoint import CheckpointWriter, load_checkpoint
 
 
 def main() -> None:
@@ -40,8 +47,9 @@ def main() -> None:
     run_name = "run_simulation"
 
     # Where to store logs (CSV + metadata). ``RunLogger`` will create this.
-    log_dir = Path("data/logs")
-    checkpoint_path = Path("data/checkpoints/latest.pkl")
+    # Resolved once up front; the checkpoint is rewritten every generation.
+    log_dir = Path("data/logs").resolve()
+    checkpoint_path = Path("data/checkpoints/latest.pkl").resolve()
 
     print("Running minimal evolution with logging...")
     print(f"Population size: {pop_size}")
@@ -49,21 +57,26 @@ def main() -> None:
     print(f"Mutation rate: {mutation_rate}")
     print(f"Crossover rate: {crossover_rate}")
     print(f"Elitism: {elitism}")
-    print(f"Log directory: {log_dir.resolve()}")
-    print(f"Checkpoint path: {checkpoint_path.resolve()}")
+    print(f"Log directory: {log_dir}")
+    print(f"Checkpoint path: {checkpoint_path}")
 
     # ---------------------------------------------------------------------
     # 2. Initial population (Load from Checkpoint if available)
     # ---------------------------------------------------------------------
     start_gen = 0
     population = None
+    # Fitness by ``Genome.structural_hash``: previously rendered structures
+    # (elites, duplicate offspring) are not rendered again. The hash is
+    # stable across runs, so the cache is carried in the checkpoint.
+    fitness_cache: dict[int, float] = {}
 
     if checkpoint_path.exists():
         try:
             print(f"[Resume] Found checkpoint at {checkpoint_path}")
-            loaded_gen, loaded_pop, _ = load_checkpoint(checkpoint_path)
+            loaded_gen, loaded_pop, extra = load_checkpoint(checkpoint_path)
             start_gen = loaded_gen + 1
             population = loaded_pop
+            fitness_cache = extra.get("fitness_cache", {})
             print(f"[Resume] Loaded population size: {len(population)}")
             print(
                 f"[Resume] Resuming from generation {start_gen + 1}/{num_generations}"
@@ -72,11 +85,11 @@ def main() -> None:
             print(f"[Resume] ERROR loading checkpoint: {e}")
             print("[Resume] Starting fresh...")
             population = None
+            fitness_cache = {}
 
     if population is None:
         print("[Init] Generating fresh population...")
-        expressions = generate_expressions_mutational(pop_size)
-        population = [Genome(pattern_tree=expression) for expression in expressions]
+        population = Genome.random_batch(pop_size)
 
     if start_gen >= num_generations:
         print(
@@ -100,7 +113,19 @@ def main() -> None:
 
     # RunLogger creates a new file with timestamp.
     # If resuming, this will be a new "segment" of the log.
-    with RunLogger(run_name=run_name, output_dir=log_dir, metadata=metadata) as logger:
+    # A single backend renders every evaluation of the run and is closed
+    # when the run ends. Checkpoints are written in the background so disk
+    # I/O overlaps with the next generation.
+    with RunLogger(
+        run_name=run_name, output_dir=log_dir, metadata=metadata
+    ) as logger, closing(create_fitness_backend()) as backend, CheckpointWriter(
+        checkpoint_path
+    ) as checkpoints:
+        # Each generation's unscored genomes are rendered in one batch on
+        # the shared backend.
+        fitness_func = partial(get_fitness, backend=backend)
+        fitness_func_batch = partial(get_fitness_batch, backend=backend)
+
         # -----------------------------------------------------------------
         # 4. Evolution loop with per-generation logging
         # -----------------------------------------------------------------
@@ -110,15 +135,22 @@ def main() -> None:
 
             population = evolve_population(
                 population=population,
-                fitness_func=get_fitness,
+                fitness_func=fitness_func,
                 mutation_rate=mutation_rate,
                 elitism=elitism,
                 crossover_rate=crossover_rate,
+                fitness_cache=fitness_cache,
+                fitness_func_batch=fitness_func_batch,
             )
 
-            # Collect fitness scores and best individual.
-            fitness_scores = [g.fitness for g in population]
-            best = max(population, key=lambda g: g.fitness)
+            # Collect fitness scores and best individual (population is
+            # returned sorted best-first).
+            fitness_scores = np.fromiter(
+                (g.fitness for g in population),
+                dtype=np.float64,
+                count=len(population),
+            )
+            best = population[0]
             best_expression = to_tidal(best.pattern_tree)
 
             logger.log_generation(
@@ -128,8 +160,10 @@ def main() -> None:
             )
 
             # Save Checkpoint
-            save_checkpoint(
-                filepath=checkpoint_path, generation=gen, population=population
+            checkpoints.save(
+                generation=gen,
+                population=population,
+                extra_data={"fitness_cache": fitness_cache},
             )
 
             gen_time = time.time() - gen_start
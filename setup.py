@@ -2,6 +2,8 @@
 Setup script for genetic-music package.
 """
 
+import os
+
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -9,6 +11,36 @@ from pathlib import Path
 readme_file = Path(__file__).parent / "README.md"
 long_description = readme_file.read_text() if readme_file.exists() else ""
 
+# Interpreter-bound pure-Python modules (tree nodes, genetic operators,
+# mutations) that may be compiled with Cython. ``tree/flat.py`` is left out
+# because Numba needs the Python bytecode of its kernels.
+CYTHON_MODULES = [
+    "src/genetic_music/tree/node.py",
+    "src/genetic_music/tree/pattern_tree.py",
+    "src/genetic_music/generator/tree_helpers.py",
+    "src/genetic_music/generator/mutations/*.py",
+    "src/genetic_music/genome/genome.py",
+    "src/genetic_music/genome/population.py",
+]
+
+
+def cython_extensions():
+    """Return compiled extensions when ``GENETIC_MUSIC_CYTHONIZE=1`` is set.
+
+    Requires Cython and a C compiler at build time. The ``.py`` sources are
+    installed either way and are used whenever no compiled module exists.
+    """
+    if os.environ.get("GENETIC_MUSIC_CYTHONIZE") != "1":
+        return []
+
+    from Cython.Build import cythonize
+
+    return cythonize(
+        CYTHON_MODULES,
+        exclude=["src/genetic_music/generator/mutations/__init__.py"],
+        language_level=3,
+    )
+
 setup(
     name="genetic-music",
     version="0.1.0",
@@ -20,6 +52,8 @@ setup(
     url="https://github.com/federicorubbi/genetic-music",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    package_data={"genetic_music.grammar": ["*.lark"]},
+    ext_modules=cython_extensions(),
     python_requires=">=3.9",
     install_requires=[
         "numpy>=1.24.0",
@@ -36,6 +70,12 @@ setup(
             "transformers>=4.30.0",
             "laion-clap>=1.1.4",
         ],
+        "jit": [
+            "numba>=0.57.0",
+        ],
+        "cython": [
+            "lark_cython>=0.0.15",
+        ],
         "viz": [
             "matplotlib>=3.7.0",
             "seaborn>=0.12.0",
@@ -1,3 +1,3 @@
-from .backend import Backend, TidalGhci
+from .backend import Backend, TidalGhci, get_shared_backend
 
-__all__ = ["Backend", "TidalGhci"]
+__all__ = ["Backend", "TidalGhci", "get_shared_backend"]
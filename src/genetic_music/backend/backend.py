@@ -3,18 +3,27 @@ Backend for driving TidalCycles via GHCi and recording audio via SuperCollider.
 - Requires: Tidal installed, a valid BootTidal.hs path, SuperDirt running.
 """
 
+import atexit
+import codecs
+import itertools
 import os
 import time
 import shlex
 import platform
+import queue
 import subprocess
-import select
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from pythonosc import udp_client
 
 
+# Sequence number for default output file names: several recordings can
+# start within the same second, and must not overwrite each other.
+_OUTPUT_COUNTER = itertools.count()
+
+
 class TidalGhci:
     """
     Launches a GHCi process, loads BootTidal.hs, and lets you eval Tidal code.
@@ -44,6 +53,17 @@ class TidalGhci:
             creationflags=creationflags,
         )
 
+        # A reader thread drains stdout in large chunks as soon as GHCi writes
+        # them, so the pipe never fills up and blocks GHCi, whatever the
+        # caller is doing. Chunks wait in a queue until they are collected
+        # (or discarded) by ``_read_available``; the incremental decoder
+        # keeps multi-byte characters split across chunks intact.
+        self._stdout_queue: "queue.Queue[bytes]" = queue.Queue()
+        threading.Thread(target=self._pump_stdout, daemon=True).start()
+        self._decoder = codecs.getincrementaldecoder(self.proc.stdout.encoding)(
+            errors="replace"
+        )
+
         # Load BootTidal.hs (standard way editors do)
         self._write(f":script {self._quote(self.boot_tidal_path)}")
         # Optional: set a distinct prompt so we can detect readiness.
@@ -70,61 +90,55 @@ class TidalGhci:
         self.proc.stdin.write(line + "\n")
         self.proc.stdin.flush()
 
-    def _read_available(self, timeout: float = 0.2, debug: bool = False) -> str:
-        """Best-effort, non-blocking read to drain output.
+    def _pump_stdout(self) -> None:
+        """Reader thread: queue GHCi output as it arrives, until EOF."""
+        read1 = self.proc.stdout.buffer.read1
+        while True:
+            try:
+                # Returns whatever is available (at least one byte), up to 64 KiB.
+                chunk = read1(65536)
+            except (OSError, ValueError):  # pipe closed
+                break
+            if not chunk:
+                break
+            self._stdout_queue.put(chunk)
 
-        This is CRITICAL to prevent pipe deadlock. GHCi writes output
-        to stdout, and if we don't read it, the pipe buffer fills up
-        (typically 65KB) and GHCi blocks on write operations.
-        """
-        if self.proc.stdout is None:
-            return ""
+    def _read_available(
+        self, timeout: float = 0.2, debug: bool = False, keep_output: bool = True
+    ) -> str:
+        """Collect the output queued by the reader thread.
 
-        out = []
-        end = time.time() + timeout
-        bytes_read = 0
+        Waits up to ``timeout`` seconds for output, returning as soon as
+        some has arrived and none follows within 10 ms. With ``timeout=0``
+        only the output already queued is taken, without waiting.
 
-        # Use select on Unix-like systems for efficient non-blocking I/O
-        if hasattr(select, "select"):
-            while time.time() < end:
-                if self.proc.poll() is not None:
+        With ``keep_output=False`` the drained bytes are discarded without
+        being decoded (unless ``debug`` needs a preview) and ``""`` is
+        returned.
+        """
+        out = []
+        end = time.monotonic() + timeout
+        raw = []
+        while True:
+            wait = min(0.01, end - time.monotonic())
+            try:
+                if wait > 0:
+                    raw.append(self._stdout_queue.get(timeout=wait))
+                else:
+                    raw.append(self._stdout_queue.get_nowait())
+            except queue.Empty:
+                if raw or wait <= 0 or self.proc.poll() is not None:
                     break
 
-                # Check if data is available with a short timeout
-                ready, _, _ = select.select([self.proc.stdout], [], [], 0.01)
-                if ready:
-                    try:
-                        chunk = self.proc.stdout.read(1)
-                        if chunk:
-                            out.append(chunk)
-                            bytes_read += 1
-                        else:
-                            break
-                    except (IOError, OSError) as e:
-                        if debug:
-                            print(f"[GHCi-Buffer] Error reading: {e}")
-                        break
-                else:
-                    # No data available, check if we should keep waiting
-                    if out:  # If we got some data, we can stop
-                        break
+        bytes_read = sum(map(len, raw))
+
+        # Decode once per drain rather than once per chunk.
+        if keep_output or debug:
+            out.append(self._decoder.decode(b"".join(raw)))
         else:
-            # Fallback for Windows: just try to read with timeout
-            # This is less efficient but works
-            while time.time() < end:
-                if self.proc.poll() is not None:
-                    break
-                try:
-                    chunk = self.proc.stdout.read(1)
-                    if chunk:
-                        out.append(chunk)
-                        bytes_read += 1
-                    else:
-                        break
-                except (IOError, OSError) as e:
-                    if debug:
-                        print(f"[GHCi-Buffer] Error reading: {e}")
-                    break
+            # Output is dropped, so a partial character must not be
+            # carried over into the next decoded drain.
+            self._decoder.reset()
 
         result = "".join(out)
         self._total_bytes_read += bytes_read
@@ -135,19 +149,20 @@ class TidalGhci:
                 f"[GHCi-Buffer] Read {bytes_read} bytes (total: {self._total_bytes_read}): {preview}..."
             )
 
-        return result
+        return result if keep_output else ""
 
     def _wait_for(self, token: str, timeout: float = 10.0):
         """Wait until GHCi prints a token (e.g., the prompt)."""
         assert self.proc.stdout is not None
-        start = time.time()
+        deadline = time.monotonic() + timeout
         buf = ""
-        while time.time() - start < timeout:
-            c = self.proc.stdout.read(1)
-            if not c:
-                time.sleep(0.01)
-                continue
-            buf += c
+        # Each read blocks until output arrives or the time left runs out,
+        # so there is no sleep/poll cycle between reads.
+        while self.proc.poll() is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            buf += self._read_available(timeout=remaining)
             if token in buf:
                 return
         # If prompt not seen, we'll still continue; print what we saw.
@@ -166,10 +181,10 @@ class TidalGhci:
 
         self._write(code)
 
-        # CRITICAL: Drain output buffer to prevent pipe deadlock
-        # Without this, after ~10 evaluations the stdout buffer fills up
-        # and GHCi blocks, causing the entire process to hang
-        self._read_available(timeout=0.1, debug=debug)
+        # The reader thread keeps the pipe drained, so there is nothing to
+        # wait for; just drop the output queued so far so it does not pile
+        # up over a long run.
+        self._read_available(timeout=0, debug=debug, keep_output=False)
 
         if debug:
             print(
@@ -206,8 +221,13 @@ class Backend:
         orbit: int = 8,  # SuperDirt orbit to render on
         stream: int = 12,  # Tidal stream d1..d16 (choose a reserved one)
         debug_buffer: bool = None,  # Enable buffer debugging
+        tidal: Optional[TidalGhci] = None,  # Running GHCi to use instead of booting one
     ):
-        self.tidal = TidalGhci(boot_tidal_path=boot_tidal_path, ghci_cmd=ghci_cmd)
+        # A GHCi passed in is owned by the caller and left running on close().
+        self._owns_tidal = tidal is None
+        if tidal is None:
+            tidal = TidalGhci(boot_tidal_path=boot_tidal_path, ghci_cmd=ghci_cmd)
+        self.tidal = tidal
         self.osc = udp_client.SimpleUDPClient(sc_host, sc_port)
         self.orbit = int(orbit)
         self.stream = int(stream)
@@ -253,15 +273,20 @@ class Backend:
             )
 
         if output_path is None:
-            output_path = self.out_dir / f"best_pattern_{int(time.time())}.wav"
+            output_path = (
+                self.out_dir
+                / f"best_pattern_{int(time.time())}_{next(_OUTPUT_COUNTER):04d}.wav"
+            )
         else:
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Always send an absolute, user-expanded path to SuperCollider so that
         # the recording ends up exactly where we expect it, regardless of the
-        # SC server's working directory.
-        output_path = output_path.expanduser().resolve()
+        # SC server's working directory. Callers that pre-resolve their
+        # output directory skip the filesystem lookups of ``resolve()``.
+        if not output_path.is_absolute():
+            output_path = output_path.expanduser().resolve()
 
         # 1) Start SC recording (pass duration)
         try:
@@ -350,4 +375,68 @@ class Backend:
 
     def close(self):
         """Clean up resources."""
-        self.tidal.close()
+        if self._owns_tidal:
+            self.tidal.close()
+
+
+# Backends shared through :func:`get_shared_backend`, keyed by their
+# constructor arguments, and the GHCi processes they run on, keyed by
+# ``(boot_tidal_path, ghci_cmd)``.
+_SHARED_BACKENDS: Dict[Tuple, Backend] = {}
+_SHARED_TIDALS: Dict[Tuple[str, str], TidalGhci] = {}
+
+
+def _close_shared_backends() -> None:
+    for tidal in _SHARED_TIDALS.values():
+        try:
+            tidal.close()
+        except Exception:
+            pass
+    _SHARED_TIDALS.clear()
+    _SHARED_BACKENDS.clear()
+
+
+atexit.register(_close_shared_backends)
+
+
+def get_shared_backend(
+    boot_tidal_path: str,
+    ghci_cmd: str = "ghci",
+    sc_host: str = "127.0.0.1",
+    sc_port: int = 57120,
+    orbit: int = 8,
+    stream: int = 12,
+    debug_buffer: bool = None,
+) -> Backend:
+    """Return a process-wide :class:`Backend`, booting it on first use.
+
+    Booting GHCi and loading BootTidal takes seconds, so code that renders
+    many patterns should reuse one backend. Calls with the same arguments
+    return the same instance. Backends that only differ in their
+    SuperCollider, orbit or stream settings run on the same GHCi process, so
+    they are cheap to create; streams left playing are hushed before a new
+    backend starts using it. The GHCi is rebooted if its process has died,
+    and closed when the interpreter exits.
+    """
+    key = (str(boot_tidal_path), ghci_cmd, sc_host, sc_port, orbit, stream, debug_buffer)
+    backend = _SHARED_BACKENDS.get(key)
+    if backend is None or backend.tidal.proc.poll() is not None:
+        tidal_key = (str(boot_tidal_path), ghci_cmd)
+        tidal = _SHARED_TIDALS.get(tidal_key)
+        if tidal is not None and tidal.proc.poll() is None:
+            tidal.hush()
+        else:
+            tidal = _SHARED_TIDALS[tidal_key] = TidalGhci(
+                boot_tidal_path=boot_tidal_path, ghci_cmd=ghci_cmd
+            )
+        backend = _SHARED_BACKENDS[key] = Backend(
+            boot_tidal_path=boot_tidal_path,
+            ghci_cmd=ghci_cmd,
+            sc_host=sc_host,
+            sc_port=sc_port,
+            orbit=orbit,
+            stream=stream,
+            debug_buffer=debug_buffer,
+            tidal=tidal,
+        )
+    return backend
@@ -2,13 +2,48 @@
 
 import os
 import pickle
+import queue
 import random
 import sys
+import threading
+import zlib
 from pathlib import Path
 from typing import Any, List, Optional, Tuple, Union
 
 from genetic_music.genome.genome import Genome
 
+# Checkpoints are zlib-compressed pickles. Pickled trees repeat the same op
+# names over and over, so even the fastest level shrinks them about tenfold.
+_COMPRESSION_LEVEL = 1
+
+
+def _dump_checkpoint(
+    generation: int,
+    population: List[Genome],
+    extra_data: Optional[dict] = None,
+) -> bytes:
+    """Serialise the evolution state (including the ``random`` state)."""
+    data = {
+        "generation": generation,
+        "population": population,
+        "rng_state": random.getstate(),
+        "extra_data": extra_data or {},
+    }
+    return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _write_checkpoint(filepath: Path, payload: bytes) -> None:
+    """Atomically replace ``filepath`` with compressed ``payload``."""
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    # Create a temporary file first to avoid corruption if interrupted
+    temp_path = filepath.with_suffix(".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(zlib.compress(payload, _COMPRESSION_LEVEL))
+
+    # Atomic rename
+    os.replace(temp_path, filepath)
+
 
 def save_checkpoint(
     filepath: Union[str, Path],
@@ -16,7 +51,7 @@ def save_checkpoint(
     population: List[Genome],
     extra_data: Optional[dict] = None,
 ) -> None:
-    """Save the current evolution state to a pickle file.
+    """Save the current evolution state to a compressed pickle file.
 
     Args
     ----
@@ -31,28 +66,102 @@ def save_checkpoint(
     """
 
     filepath = Path(filepath)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
+    _write_checkpoint(filepath, _dump_checkpoint(generation, population, extra_data))
+    print(f"[Checkpoint] Saved generation {generation} to {filepath}")
 
-    # Create a temporary file first to avoid corruption if interrupted
-    temp_path = filepath.with_suffix(".tmp")
 
-    data = {
-        "generation": generation,
-        "population": population,
-        "rng_state": random.getstate(),
-        "extra_data": extra_data or {},
-    }
+class CheckpointWriter:
+    """Save checkpoints to a single file from a background thread.
 
-    with open(temp_path, "wb") as f:
-        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    :meth:`save` serialises the state immediately, on the calling thread, so
+    the caller may keep mutating the population and ``extra_data`` right
+    away; only compression and the file write are deferred. If a checkpoint is still waiting
+    to be written when a newer one arrives, the stale one is dropped, since
+    only the latest file survives anyway. :meth:`close` (or leaving the
+    ``with`` block) writes the last pending checkpoint before returning.
 
-    # Atomic rename
-    os.replace(temp_path, filepath)
-    print(f"[Checkpoint] Saved generation {generation} to {filepath}")
+    Example
+    -------
+    >>> with CheckpointWriter("data/checkpoints/latest.pkl") as checkpoints:
+    ...     for gen in range(n_generations):
+    ...         population = evolve_population(population, fitness_func)
+    ...         checkpoints.save(gen, population)
+    """
+
+    def __init__(self, filepath: Union[str, Path]) -> None:
+        self.filepath = Path(filepath)
+        self._pending: "queue.Queue[Optional[Tuple[int, bytes]]]" = queue.Queue(
+            maxsize=1
+        )
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="checkpoint-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            generation, payload = item
+            try:
+                _write_checkpoint(self.filepath, payload)
+            except Exception as e:  # surfaced by the next save()/close()
+                self._error = e
+                continue
+            print(f"[Checkpoint] Saved generation {generation} to {self.filepath}")
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def save(
+        self,
+        generation: int,
+        population: List[Genome],
+        extra_data: Optional[dict] = None,
+    ) -> None:
+        """Queue a checkpoint; see :func:`save_checkpoint` for the arguments."""
+        if self._closed:
+            raise RuntimeError("Cannot save on a closed CheckpointWriter.")
+        self._raise_pending_error()
+
+        item = (generation, _dump_checkpoint(generation, population, extra_data))
+        while True:
+            try:
+                self._pending.put_nowait(item)
+                return
+            except queue.Full:
+                # Drop the older checkpoint that has not been written yet.
+                try:
+                    self._pending.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def close(self) -> None:
+        """Write the pending checkpoint, if any, and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._pending.put(None)
+        self._thread.join()
+        self._raise_pending_error()
+
+    def __enter__(self) -> "CheckpointWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
 
 def load_checkpoint(filepath: Union[str, Path]) -> Tuple[int, List[Genome], Any]:
-    """Load evolution state from a pickle file.
+    """Load evolution state from a checkpoint file.
+
+    Both compressed checkpoints and the plain pickles written by earlier
+    versions are accepted.
 
     Returns
     -------
@@ -74,7 +183,11 @@ def load_checkpoint(filepath: Union[str, Path]) -> Tuple[int, List[Genome], Any]
         sys.setrecursionlimit(10_000)
 
     with open(filepath, "rb") as f:
-        data = pickle.load(f)
+        payload = f.read()
+    # Plain pickles (protocol 2+) start with the PROTO opcode.
+    if not payload.startswith(pickle.PROTO):
+        payload = zlib.decompress(payload)
+    data = pickle.loads(payload)
 
     if "rng_state" in data:
         random.setstate(data["rng_state"])
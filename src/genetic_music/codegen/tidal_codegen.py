@@ -8,23 +8,103 @@ Tidal grammar, this already yields valid Tidal source for any parsed pattern.
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
-from lark import Lark
+from lark import Lark, Token, Tree
 from lark.reconstruct import Reconstructor
+from lark.utils import is_id_continue
 
+from genetic_music.grammar import MAIN_GRAMMAR_PATH
+from genetic_music.tree.node import TreeNode
 from genetic_music.tree.pattern_tree import PatternTree
 
 # Build a dedicated parser instance for reconstruction. We deliberately disable
 # ``maybe_placeholders`` so that Lark's :class:`Reconstructor` can operate on
-# the grammar (it asserts this option is ``False``).
+# the grammar (it asserts this option is ``False``). The reconstructor only
+# needs the grammar rules, so an LALR parser is used: unlike Earley it can be
+# cached on disk (``cache=True``), which makes warm imports much faster.
 _RECON_PARSER: Lark = Lark.open(
-    "src/genetic_music/grammar/main.lark",
+    MAIN_GRAMMAR_PATH,
     start="control_pattern",
     maybe_placeholders=False,
+    parser="lalr",
+    lexer="contextual",
+    cache=True,
 )
 _RECONSTRUCTOR: Reconstructor = Reconstructor(_RECON_PARSER)
 
+# Token layout of each rule application, keyed by the rule and the
+# ``(name, is_rule)`` kinds of its children: ``None`` marks where the next
+# child is written, strings are the anonymous tokens (brackets, operators,
+# ...) that the parse tree leaves out. The reconstructor derives a layout by
+# matching the children against the grammar, which only depends on this
+# key, so each distinct layout is derived once.
+_LAYOUTS: Dict[Tuple, Tuple[Optional[str], ...]] = {}
+
+# Generated code keyed by :meth:`PatternTree.structural_hash`. The same tree
+# is typically rendered several times (logging, evaluation, display), and
+# elites survive unchanged across generations. The dict is kept in
+# least-recently-used order (hits are moved to the end), so the least
+# recently rendered tree is evicted once the cache is full.
+_TIDAL_CODE_CACHE: Dict[int, str] = {}
+_TIDAL_CODE_CACHE_SIZE = 4096
+
+
+def _is_rule(node: TreeNode) -> bool:
+    """Whether ``node`` is a rule (``Tree``) in the Lark parse tree."""
+    return bool(node.children) or node.value is None
+
+
+def _layout(node: TreeNode) -> Tuple[Optional[str], ...]:
+    """Return the token layout of rule node ``node`` (see ``_LAYOUTS``)."""
+    key = (node.op, tuple((child.op, _is_rule(child)) for child in node.children))
+    layout = _LAYOUTS.get(key)
+    if layout is None:
+        # Match a childless stand-in: only the names of the children matter.
+        probe = Tree(
+            node.op,
+            [Tree(op, []) if is_rule else Token(op, "") for op, is_rule in key[1]],
+        )
+        written = _RECONSTRUCTOR.write_tokens.transform(
+            _RECONSTRUCTOR.match_tree(probe, node.op)
+        )
+        layout = tuple(
+            None if isinstance(item, (Tree, Token)) else item for item in written
+        )
+        _LAYOUTS[key] = layout
+    return layout
+
+
+def _emit(node: TreeNode, out: List[str]) -> None:
+    """Append the tokens of ``node`` to ``out``, in source order."""
+    if not _is_rule(node):
+        out.append(str(node.value))
+        return
+    children = iter(node.children)
+    for part in _layout(node):
+        if part is None:
+            _emit(next(children), out)
+        else:
+            out.append(part)
+
+
+def _reconstruct(root: TreeNode) -> str:
+    """Equivalent of ``_RECONSTRUCTOR.reconstruct(tree.to_lark_tree())``.
+
+    Tokens are joined with the same spacing rule as
+    :meth:`lark.reconstruct.Reconstructor.reconstruct`.
+    """
+    tokens: List[str] = []
+    _emit(root, tokens)
+    out: List[str] = []
+    prev = ""
+    for token in tokens:
+        if prev and token and is_id_continue(prev[-1]) and is_id_continue(token[0]):
+            out.append(" ")
+        out.append(token)
+        prev = token
+    return "".join(out)
+
 
 def to_tidal(tree: PatternTree) -> str:
     """Convert a `PatternTree` into a Tidal pattern string.
@@ -34,9 +114,22 @@ def to_tidal(tree: PatternTree) -> str:
     1. Reconstruct the original Lark parse tree via
        :meth:`PatternTree.to_lark_tree`, which inverts the internal
        ``TreeNode`` representation back into a :class:`lark.Tree`.
-    2. Use Lark's :class:`Reconstructor` (built from the Earley parser) to
+    2. Use Lark's :class:`Reconstructor` (built from the grammar rules) to
        generate a textual ``control_pattern`` expression that is guaranteed to
        be accepted by the same grammar and to preserve the original structure.
+
+    Both steps are carried out directly on the ``TreeNode`` tree: the
+    reconstructor is only consulted once per distinct rule layout (see
+    ``_LAYOUTS``), which avoids its per-node grammar matching.
+
+    Results are memoised by the tree's structural hash, the same key used
+    by fitness caches.
     """
-    lark_tree = tree.to_lark_tree()
-    return _RECONSTRUCTOR.reconstruct(lark_tree)
+    key = tree.structural_hash()
+    code = _TIDAL_CODE_CACHE.pop(key, None)
+    if code is None:
+        code = _reconstruct(tree.root)
+        if len(_TIDAL_CODE_CACHE) >= _TIDAL_CODE_CACHE_SIZE:
+            del _TIDAL_CODE_CACHE[next(iter(_TIDAL_CODE_CACHE))]
+    _TIDAL_CODE_CACHE[key] = code
+    return code
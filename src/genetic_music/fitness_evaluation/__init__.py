@@ -10,8 +10,12 @@ Public API
 From :mod:`.fitness_evaluation`:
     - :func:`evaluate_genome_fitness` - Evaluate genome fitness (main entry point)
     - :func:`get_fitness` - Convenience function with defaults
+    - :func:`get_fitness_batch` - Evaluate several genomes on one backend
+    - :func:`create_fitness_backend` - Boot a backend to share across evaluations
     - :func:`feature_similarity` - Extract and compare audio features
+    - :func:`extract_features` - Extract the features of one waveform
     - :func:`compute_fitness` - Weighted fitness aggregation
+    - :func:`compute_fitness_batch` - Score several candidate files in parallel
     - :data:`DEFAULT_WEIGHTS` - Default feature weights
     - :func:`dominates` - Multi-objective dominance check
     - :func:`pareto_front` - Pareto front computation
@@ -20,18 +24,26 @@ From :mod:`.fitness_evaluation`:
 from .fitness_evaluation import (
     DEFAULT_WEIGHTS,
     compute_fitness,
+    compute_fitness_batch,
+    create_fitness_backend,
     # dominates,
     evaluate_genome_fitness,
+    extract_features,
     feature_similarity,
     get_fitness,
+    get_fitness_batch,
     # pareto_front,
 )
 
 __all__ = [
     "evaluate_genome_fitness",
     "get_fitness",
+    "get_fitness_batch",
+    "create_fitness_backend",
     "feature_similarity",
+    "extract_features",
     "compute_fitness",
+    "compute_fitness_batch",
     "DEFAULT_WEIGHTS",
     # "dominates",
     # "pareto_front",
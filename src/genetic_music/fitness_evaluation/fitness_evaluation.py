@@ -7,15 +7,19 @@ audio feature similarity to a target audio file.
 from __future__ import annotations
 
 import os
+import random
 import time
 import signal
-from typing import Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache, partial
+from typing import Callable, Dict, List, Optional, Sequence
 
 import librosa
 import numpy as np
-from pydub import AudioSegment
+import soundfile as sf
 
-from genetic_music.backend.backend import Backend
+from genetic_music.backend.backend import Backend, get_shared_backend
 from genetic_music.codegen.tidal_codegen import to_tidal
 from genetic_music.genome.genome import Genome
 from librosa.feature.rhythm import tempo as tempo_fn
@@ -24,6 +28,19 @@ from librosa.feature.rhythm import tempo as tempo_fn
 # Keyed by (absolute_path, sampling_rate).
 _TARGET_AUDIO_CACHE: Dict[tuple[str, int], tuple[np.ndarray, int]] = {}
 
+# Features of the target audio truncated to a given number of samples.
+# Keyed by (absolute_path, sampling_rate, n_samples); candidates are rendered
+# with a fixed duration, so in practice there is one entry per target.
+_TARGET_FEATURES_CACHE: Dict[tuple[str, int, int], "AudioFeatures"] = {}
+
+# Sampling rate used for pitch extraction (YIN), well above the 2 kHz needed
+# for its fmax of 1 kHz.
+_PITCH_SR = 8000
+
+# Dedicated RNG for candidate file names, so rendering does not consume the
+# module-level ``random`` state that drives (possibly seeded) evolution.
+_FILENAME_RNG = random.Random()
+
 
 class FitnessTimeoutError(TimeoutError):
     """Raised when a fitness evaluation exceeds the allowed time."""
@@ -47,7 +64,11 @@ def ensure_wav(path: str | os.PathLike) -> str:
     """Ensure the audio file at the given path is available in .wav format.
 
     If the file is not already a .wav, converts from mp3 or other formats
-    as needed.
+    as needed. Formats supported by libsndfile (flac, ogg, aiff, ...) are
+    decoded in-process with :mod:`soundfile`; anything else (e.g. mp3 on older
+    libsndfile builds) is decoded with :func:`librosa.load`, which falls back
+    to audioread. The sample format of the source is kept where WAV supports
+    it, and 32-bit float is used otherwise.
 
     Parameters
     ----------
@@ -67,8 +88,18 @@ def ensure_wav(path: str | os.PathLike) -> str:
 
     wav_path = os.path.splitext(path)[0] + ".wav"
     if not os.path.exists(wav_path):
-        audio = AudioSegment.from_file(path)
-        audio.export(wav_path, format="wav")
+        try:
+            data, sr = sf.read(path)
+            subtype = sf.info(path).subtype
+        except RuntimeError:  # sf.LibsndfileError: format not supported
+            y, sr = librosa.load(path, sr=None, mono=False)
+            data = y.T  # librosa is (channels, samples), soundfile the reverse
+            subtype = "FLOAT"
+        # Keep the source sample format (e.g. 24-bit PCM); compressed ones
+        # such as Vorbis have no WAV equivalent and are stored as float.
+        if not sf.check_format("WAV", subtype):
+            subtype = "FLOAT"
+        sf.write(wav_path, data, sr, subtype=subtype)
 
     return wav_path
 
@@ -128,13 +159,20 @@ def cosine_matrix_similarity(
 
     min_cols = min(M1.shape[1], M2.shape[1])
     M1, M2 = M1[:, :min_cols], M2[:, :min_cols]
-    sims = [
-        cosine_similarity(M1[:, i], M2[:, i], eps)
-        for i in range(min_cols)
-        if not np.isnan(M1[:, i]).any() and not np.isnan(M2[:, i]).any()
-    ]
 
-    return float(np.mean(sims)) if sims else 0.0
+    # Frames containing NaNs are skipped; as in :func:`cosine_similarity`,
+    # near-silent frames count as 0. All frames are handled in one pass.
+    valid = ~(np.isnan(M1).any(axis=0) | np.isnan(M2).any(axis=0))
+    if not valid.any():
+        return 0.0
+    M1, M2 = M1[:, valid], M2[:, valid]
+
+    dots = np.einsum("ij,ij->j", M1, M2)
+    norm1, norm2 = np.linalg.norm(M1, axis=0), np.linalg.norm(M2, axis=0)
+    audible = (norm1 >= eps) & (norm2 >= eps)
+    sims = np.divide(dots, norm1 * norm2, out=np.zeros_like(dots), where=audible)
+
+    return float(np.mean(sims, dtype=np.float64))
 
 
 def fft_similarity(sig1: np.ndarray, sig2: np.ndarray) -> float:
@@ -155,13 +193,201 @@ def fft_similarity(sig1: np.ndarray, sig2: np.ndarray) -> float:
 
     min_len = min(len(sig1), len(sig2))
     sig1, sig2 = sig1[:min_len], sig2[:min_len]
-    fft1, fft2 = np.fft.fft(sig1), np.fft.fft(sig2)
-    mag1, mag2 = np.abs(fft1), np.abs(fft2)
+    mag1, mag2 = _fft_magnitude(sig1), _fft_magnitude(sig2)
     sim = cosine_similarity(mag1, mag2)
 
     return float(np.clip(sim, 0, 1))
 
 
+def _fft_magnitude(sig: np.ndarray) -> np.ndarray:
+    """Magnitude spectrum compared by :func:`fft_similarity`.
+
+    The spectrum of a real signal is symmetric, so only the non-negative
+    frequencies are computed (``rfft``, half the work of a full FFT). Bins
+    that appear twice in the full spectrum (all but DC and Nyquist) are
+    scaled by sqrt(2), which keeps cosine similarities identical to those of
+    the full magnitude spectrum.
+    """
+    mag = np.abs(np.fft.rfft(sig))
+    mag[1 : (len(sig) + 1) // 2] *= np.sqrt(2.0)
+    return mag
+
+
+@dataclass
+class AudioFeatures:
+    """Features of one waveform, as compared by :func:`feature_similarity`.
+
+    ``pitch`` is ``None`` if pitch extraction failed.
+    """
+
+    mfcc: np.ndarray
+    chroma: np.ndarray
+    onset_env: np.ndarray
+    fft_mag: np.ndarray
+    rms: np.ndarray
+    tempo: float
+    pitch: Optional[np.ndarray]
+
+
+@lru_cache(maxsize=8)
+def _mel_filters(sr: int, n_fft: int) -> np.ndarray:
+    """Default ``librosa.filters.mel`` filterbank, built once per size."""
+    mel_basis = librosa.filters.mel(sr=sr, n_fft=n_fft)
+    mel_basis.flags.writeable = False  # shared between callers
+    return mel_basis
+
+
+@lru_cache(maxsize=128)
+def _chroma_filters(sr: int, n_fft: int, tuning: float) -> np.ndarray:
+    """Default ``librosa.filters.chroma`` filterbank, built once per tuning.
+
+    Estimated tunings are quantised to 0.01 bins, so few distinct ones occur.
+    """
+    chroma_basis = librosa.filters.chroma(sr=sr, n_fft=n_fft, tuning=tuning)
+    chroma_basis.flags.writeable = False  # shared between callers
+    return chroma_basis
+
+
+class _LazyFeatures:
+    """The :class:`AudioFeatures` fields of ``y``, each extracted on first access.
+
+    Lets :func:`compute_fitness` skip the extraction of features it never
+    compares when it stops early.
+    """
+
+    def __init__(self, y: np.ndarray, sr: int) -> None:
+        self.y = y
+        self.sr = sr
+
+    @cached_property
+    def power_spec(self) -> np.ndarray:
+        # Shared by MFCC and chroma, which would otherwise each run this
+        # same (default parameter) STFT.
+        return np.abs(librosa.stft(self.y)) ** 2
+
+    @cached_property
+    def log_mel(self) -> np.ndarray:
+        # The default log-power mel spectrogram, built with a cached mel
+        # filterbank. ``librosa.feature.mfcc`` and ``onset_strength`` would
+        # each compute this same spectrogram from ``y``.
+        S = self.power_spec
+        mel = _mel_filters(self.sr, 2 * (S.shape[0] - 1)) @ S
+        return librosa.power_to_db(mel)
+
+    @cached_property
+    def mfcc(self) -> np.ndarray:
+        # Same as ``librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)``.
+        return librosa.feature.mfcc(S=self.log_mel, n_mfcc=13)
+
+    @cached_property
+    def chroma(self) -> np.ndarray:
+        # Same as ``librosa.feature.chroma_stft(S=power_spec, sr=sr)``, with
+        # a cached chroma filterbank.
+        S = self.power_spec
+        tuning = librosa.estimate_tuning(S=S, sr=self.sr, bins_per_octave=12)
+        raw = _chroma_filters(self.sr, 2 * (S.shape[0] - 1), tuning) @ S
+        return librosa.util.normalize(raw, norm=np.inf, axis=-2)
+
+    @cached_property
+    def onset_env(self) -> np.ndarray:
+        # Same as ``librosa.onset.onset_strength(y=y, sr=sr)``.
+        return librosa.onset.onset_strength(S=self.log_mel, sr=self.sr)
+
+    @cached_property
+    def fft_mag(self) -> np.ndarray:
+        return _fft_magnitude(self.y)
+
+    @cached_property
+    def rms(self) -> np.ndarray:
+        return librosa.feature.rms(y=self.y)
+
+    @cached_property
+    def tempo(self) -> float:
+        # Same as ``tempo_fn(y=y, sr=sr)``. Given ``y``, the estimator builds
+        # its onset envelope with ``aggregate=np.median``, so it cannot reuse
+        # ``onset_env`` (mean aggregate), only the spectrogram behind it.
+        onset_env = librosa.onset.onset_strength(
+            S=self.log_mel, sr=self.sr, aggregate=np.median
+        )
+        return tempo_fn(onset_envelope=onset_env, sr=self.sr)[0]
+
+    @cached_property
+    def pitch(self) -> Optional[np.ndarray]:
+        # Melody/Pitch Contour. Pitch is only tracked up to 1 kHz, so YIN runs
+        # on a copy resampled to _PITCH_SR, with ~128 ms frames and ~32 ms
+        # hops.
+        try:
+            y_pitch = librosa.resample(self.y, orig_sr=self.sr, target_sr=_PITCH_SR)
+            return librosa.yin(
+                y_pitch,
+                fmin=80,
+                fmax=1000,
+                sr=_PITCH_SR,
+                frame_length=1024,
+                hop_length=256,
+            )
+        except Exception:
+            return None  # Compared as 0.0 similarity
+
+
+def extract_features(y: np.ndarray, sr: int) -> AudioFeatures:
+    """Extract all features of waveform ``y`` sampled at ``sr``.
+
+    Parameters
+    ----------
+    y:
+        Audio waveform, already truncated to the length it is compared at.
+    sr:
+        Sampling rate of ``y``.
+
+    Returns
+    -------
+    AudioFeatures
+        The extracted features.
+    """
+
+    lazy = _LazyFeatures(y, sr)
+    return AudioFeatures(
+        **{field.name: getattr(lazy, field.name) for field in fields(AudioFeatures)}
+    )
+
+
+def _melody_similarity(f1: AudioFeatures, f2: AudioFeatures) -> float:
+    if f1.pitch is None or f2.pitch is None:
+        return 0.0  # Fallback if pitch extraction failed
+    return cosine_similarity(f1.pitch, f2.pitch)
+
+
+# Similarity of each feature compared by :func:`compare_features`. None
+# exceeds 1 in absolute value; the clipped ones (fft, tempo) are in [0, 1].
+_FEATURE_SIMILARITIES: Dict[str, Callable[[AudioFeatures, AudioFeatures], float]] = {
+    # Timbre (MFCC): to match timbre
+    "mfcc": lambda f1, f2: cosine_matrix_similarity(f1.mfcc, f2.mfcc),
+    # Harmony (Chroma): to match harmonic content
+    "chroma": lambda f1, f2: cosine_matrix_similarity(f1.chroma, f2.chroma),
+    # Rhythm: to match rhythmic patterns
+    "rhythm": lambda f1, f2: cosine_similarity(f1.onset_env, f2.onset_env),
+    # Spectral Distribution (FFT): to match overall spectral shape
+    "fft": lambda f1, f2: float(
+        np.clip(cosine_similarity(f1.fft_mag, f2.fft_mag), 0, 1)
+    ),
+    # Dynamics (RMS Energy Curve): to match dynamics
+    "rms": lambda f1, f2: cosine_matrix_similarity(f1.rms, f2.rms),
+    # Tempo: to match BPM
+    "tempo": lambda f1, f2: float(
+        np.clip(1 - abs(f1.tempo - f2.tempo) / max(f1.tempo, f2.tempo), 0, 1)
+    ),
+    # Melody/Pitch Contour: to match pitch progression
+    "melody": _melody_similarity,
+}
+
+
+def compare_features(f1: AudioFeatures, f2: AudioFeatures) -> Dict[str, float]:
+    """Compare two feature sets; see :func:`feature_similarity`."""
+
+    return {name: sim(f1, f2) for name, sim in _FEATURE_SIMILARITIES.items()}
+
+
 def feature_similarity(
     audio1: str | os.PathLike, audio2: str | os.PathLike, sr: int = 22050
 ) -> Dict[str, float]:
@@ -187,6 +413,19 @@ def feature_similarity(
         - melody: Pitch contour similarity
     """
 
+    y1, sr1, target_features = _load_candidate(audio1, audio2, sr)
+    return compare_features(extract_features(y1, sr1), target_features)
+
+
+def _load_candidate(
+    audio1: str | os.PathLike, audio2: str | os.PathLike, sr: int
+) -> tuple[np.ndarray, int, AudioFeatures]:
+    """Load candidate ``audio1`` and the cached features of target ``audio2``.
+
+    Returns the candidate waveform truncated to the compared length, its
+    sampling rate, and the target's features at that length.
+    """
+
     audio1, audio2 = ensure_wav(audio1), ensure_wav(audio2)
 
     # Always load the *candidate* audio fresh – this changes every evaluation.
@@ -195,7 +434,8 @@ def feature_similarity(
     # Cache the *target* audio (second argument) so we don't reload it from disk
     # for every genome evaluation. This assumes the second argument is the
     # long‑lived target, which is how this module is used by the evolution loop.
-    cache_key = (os.path.abspath(audio2), sr)
+    target_path = os.path.abspath(audio2)
+    cache_key = (target_path, sr)
     if cache_key in _TARGET_AUDIO_CACHE:
         y2, sr2 = _TARGET_AUDIO_CACHE[cache_key]
     else:
@@ -203,49 +443,17 @@ def feature_similarity(
         _TARGET_AUDIO_CACHE[cache_key] = (y2, sr2)
 
     min_len = min(len(y1), len(y2))
-    y1, y2 = y1[:min_len], y2[:min_len]
-
-    features: Dict[str, float] = {}
-
-    # Timbre (MFCC): to match timbre
-    mfcc1 = librosa.feature.mfcc(y=y1, sr=sr1, n_mfcc=13)
-    mfcc2 = librosa.feature.mfcc(y=y2, sr=sr2, n_mfcc=13)
-    features["mfcc"] = cosine_matrix_similarity(mfcc1, mfcc2)
-
-    # Harmony (Chroma): to match harmonic content
-    S1, S2 = np.abs(librosa.stft(y1)) ** 2, np.abs(librosa.stft(y2)) ** 2
-    chroma1 = librosa.feature.chroma_stft(S=S1, sr=sr1)
-    chroma2 = librosa.feature.chroma_stft(S=S2, sr=sr2)
-    features["chroma"] = cosine_matrix_similarity(chroma1, chroma2)
-
-    # Rhythm: to match rhythmic patterns
-    onset_env1 = librosa.onset.onset_strength(y=y1, sr=sr1)
-    onset_env2 = librosa.onset.onset_strength(y=y2, sr=sr2)
-    features["rhythm"] = cosine_similarity(onset_env1, onset_env2)
-
-    # Spectral Distribution (FFT): to match overall spectral shape
-    features["fft"] = fft_similarity(y1, y2)
-
-    # Dynamics (RMS Energy Curve): to match dynamics
-    rms1, rms2 = librosa.feature.rms(y=y1), librosa.feature.rms(y=y2)
-    features["rms"] = cosine_matrix_similarity(rms1, rms2)
+    y1 = y1[:min_len]
 
-    # Tempo: to match BPM
-    tempo1 = tempo_fn(y=y1, sr=sr1)[0]
-    tempo2 = tempo_fn(y=y2, sr=sr2)[0]
-    features["tempo"] = float(
-        np.clip(1 - abs(tempo1 - tempo2) / max(tempo1, tempo2), 0, 1)
-    )
-
-    # Melody/Pitch Contour: to match pitch progression
-    try:
-        pitch1 = librosa.yin(y1, fmin=80, fmax=1000)
-        pitch2 = librosa.yin(y2, fmin=80, fmax=1000)
-        features["melody"] = cosine_similarity(pitch1, pitch2)
-    except Exception:
-        features["melody"] = 0.0  # Fallback if pitch extraction fails
+    # The target's features only depend on how far it is truncated, so they
+    # are extracted once per length instead of once per candidate.
+    features_key = (target_path, sr, min_len)
+    target_features = _TARGET_FEATURES_CACHE.get(features_key)
+    if target_features is None:
+        target_features = extract_features(y2[:min_len], sr2)
+        _TARGET_FEATURES_CACHE[features_key] = target_features
 
-    return features
+    return y1, sr1, target_features
 
 
 # ---------------------------------------------------------------------------
@@ -267,9 +475,18 @@ def compute_fitness(
     candidate_file: str | os.PathLike,
     target_file: str | os.PathLike,
     weights: Optional[Dict[str, float]] = None,
+    cutoff: Optional[float] = None,
 ) -> tuple[float, Dict[str, float]]:
     """Compute weighted fitness based on all active features.
 
+    With a ``cutoff``, features are compared in decreasing order of weight
+    and only extracted when needed. Comparison stops as soon as the
+    candidate cannot reach ``cutoff`` even if all remaining features matched
+    perfectly; the returned fitness is then the partial sum so far, which
+    is below ``cutoff``, and the feature dictionary holds only the
+    features that were compared. Use it when a candidate scoring below
+    ``cutoff`` is discarded regardless of its exact score.
+
     Parameters
     ----------
     candidate_file:
@@ -279,6 +496,8 @@ def compute_fitness(
     weights:
         Feature weights for aggregation. If ``None``, uses
         :data:`DEFAULT_WEIGHTS`.
+    cutoff:
+        Optional fitness below which evaluation may stop early (see above).
 
     Returns
     -------
@@ -291,12 +510,89 @@ def compute_fitness(
     if weights is None:
         weights = DEFAULT_WEIGHTS
 
-    sims = feature_similarity(candidate_file, target_file)
-    fitness = sum(weights[k] * sims.get(k, 0) for k in weights.keys())
+    if cutoff is None:
+        sims = feature_similarity(candidate_file, target_file)
+        fitness = sum(weights[k] * sims.get(k, 0) for k in weights.keys())
+        return fitness, sims
+
+    # Same sampling rate as :func:`feature_similarity` uses by default.
+    y1, sr1, target_features = _load_candidate(candidate_file, target_file, 22050)
+    candidate_features = _LazyFeatures(y1, sr1)
+
+    # Each similarity is at most 1 in absolute value, so a feature can still
+    # add at most abs(weight) to the fitness.
+    sims = {}
+    fitness = 0.0
+    remaining = sum(abs(w) for w in weights.values())
+    for name in sorted(weights, key=lambda k: abs(weights[k]), reverse=True):
+        sim = _FEATURE_SIMILARITIES.get(name)
+        if sim is not None:
+            sims[name] = sim(candidate_features, target_features)
+            fitness += weights[name] * sims[name]
+        remaining -= abs(weights[name])
+        if fitness + remaining < cutoff:
+            break
 
     return fitness, sims
 
 
+def compute_fitness_batch(
+    candidate_files: Sequence[str | os.PathLike],
+    target_file: str | os.PathLike,
+    weights: Optional[Dict[str, float]] = None,
+    n_workers: Optional[int] = None,
+    cutoff: Optional[float] = None,
+) -> List[tuple[float, Dict[str, float]]]:
+    """Compute :func:`compute_fitness` for several candidates in parallel.
+
+    Candidates are independent, so they are spread over a process pool;
+    each worker extracts the target's features once and reuses them for
+    all the candidates it scores.
+
+    Parameters
+    ----------
+    candidate_files:
+        Paths to the candidate audio files.
+    target_file:
+        Path to the target audio file.
+    weights:
+        Feature weights for aggregation; see :func:`compute_fitness`.
+    n_workers:
+        Number of worker processes. Defaults to the number of CPUs; with 1
+        the candidates are scored on the calling process.
+    cutoff:
+        Optional early-stopping threshold; see :func:`compute_fitness`.
+
+    Returns
+    -------
+    List[tuple[float, Dict[str, float]]]
+        ``(fitness_score, feature_dict)`` for each candidate, in order.
+    """
+
+    # Convert the target once rather than in every worker.
+    score = partial(
+        compute_fitness,
+        target_file=ensure_wav(target_file),
+        weights=weights,
+        cutoff=cutoff,
+    )
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = min(n_workers, len(candidate_files))
+    if n_workers <= 1:
+        return [score(candidate) for candidate in candidate_files]
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        return list(
+            pool.map(
+                score,
+                candidate_files,
+                chunksize=max(1, len(candidate_files) // (4 * n_workers)),
+            )
+        )
+
+
 # ---------------------------------------------------------------------------
 # Multi-objective optimization helpers: FOR FUTURE DEVELOPMENT
 # ---------------------------------------------------------------------------
@@ -363,6 +659,7 @@ def evaluate_genome_fitness(
     candidate_output_dir: str | os.PathLike,
     duration: float = 4.0,
     weights: Optional[Dict[str, float]] = None,
+    cutoff: Optional[float] = None,
 ) -> float:
     """Evaluate the fitness of a genome by rendering its audio and comparing to a target.
 
@@ -381,6 +678,8 @@ def evaluate_genome_fitness(
     weights:
         Feature weights for fitness aggregation. If ``None``, uses
         :data:`DEFAULT_WEIGHTS`.
+    cutoff:
+        Optional early-stopping threshold; see :func:`compute_fitness`.
 
     Returns
     -------
@@ -398,9 +697,7 @@ def evaluate_genome_fitness(
 
     # Use unique filename to avoid file contention/locking issues
     # Include timestamp and random component for uniqueness
-    import random
-
-    unique_id = f"{int(time.time() * 1000)}_{random.randint(1000, 9999)}"
+    unique_id = f"{int(time.time() * 1000)}_{_FILENAME_RNG.randint(1000, 9999)}"
     candidate_output_path = os.path.join(
         candidate_output_dir, f"candidate_{unique_id}.wav"
     )
@@ -430,7 +727,9 @@ def evaluate_genome_fitness(
     # Compute fitness
     features_start = time.time()
     try:
-        fitness, _ = compute_fitness(recorded_path, target_wav, weights=weights)
+        fitness, _ = compute_fitness(
+            recorded_path, target_wav, weights=weights, cutoff=cutoff
+        )
     except Exception as e:
         print(f"[Fitness] ERROR during feature computation: {e}")
         fitness = 0.0
@@ -461,12 +760,28 @@ def evaluate_genome_fitness(
 # ---------------------------------------------------------------------------
 
 
-def _get_fitness_impl(genome: Genome) -> float:
-    """Internal implementation of fitness evaluation without timeout guards.
+# Default target audio and candidate render directory, resolved once
+# relative to the repository root.
+_BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+DEFAULT_TARGET_PATH = os.path.normpath(
+    os.path.join(_BASE_DIR, "../../../data/target/target.mp3")
+)
+DEFAULT_CANDIDATE_DIR = os.path.normpath(
+    os.path.join(_BASE_DIR, "../../../data/candidate/candidate_audio")
+)
 
-    This contains the original logic of :func:`get_fitness`. It is wrapped by
-    :func:`get_fitness` below, which adds a per-call timeout so that a single
-    bad backend interaction cannot stall a long evolutionary run.
+
+def create_fitness_backend(shared: bool = False) -> Backend:
+    """Boot a :class:`Backend` configured for fitness rendering.
+
+    The BootTidal.hs path is read from the configuration. Create the backend
+    once per run and pass it to :func:`get_fitness` so that GHCi/SuperCollider
+    are not rebooted for every evaluated genome; the caller is responsible for
+    calling :meth:`Backend.close`.
+
+    With ``shared=True`` the process-wide backend from
+    :func:`~genetic_music.backend.backend.get_shared_backend` is returned
+    instead, booted on first use and closed at interpreter exit.
     """
 
     # Load configuration
@@ -482,37 +797,44 @@ def _get_fitness_impl(genome: Genome) -> float:
     except FileNotFoundError as e:
         raise FileNotFoundError(str(e))
 
-    backend = Backend(
+    factory = get_shared_backend if shared else Backend
+    return factory(
         boot_tidal_path=BOOT_TIDAL,
         orbit=8,  # SuperDirt orbit to render on
         stream=12,  # dedicated Tidal stream (d12)
         debug_buffer=True,  # Enable buffer debugging to diagnose hangs
     )
 
-    try:
-        base_dir = os.path.dirname(os.path.realpath(__file__))
-        target = os.path.join(base_dir, "../../../data/target/target.mp3")
-        candidate_dir = os.path.join(
-            base_dir, "../../../data/candidate/candidate_audio"
-        )
 
-        return evaluate_genome_fitness(
-            genome=genome,
-            backend=backend,
-            target_audio_path=target,
-            candidate_output_dir=candidate_dir,
-            duration=4.0,
-        )
-    finally:
-        # VERY IMPORTANT: ensure we don't leak GHCi/SC processes.
-        # Each get_fitness() call should clean up its Backend.
-        try:
-            backend.close()
-        except Exception:
-            pass
+def _get_fitness_impl(genome: Genome, backend: Optional[Backend] = None) -> float:
+    """Internal implementation of fitness evaluation without timeout guards.
+
+    This contains the original logic of :func:`get_fitness`. It is wrapped by
+    :func:`get_fitness` below, which adds a per-call timeout so that a single
+    bad backend interaction cannot stall a long evolutionary run.
+
+    If ``backend`` is ``None`` the shared fitness backend is used (see
+    :func:`create_fitness_backend`), so repeated calls do not reboot
+    GHCi/SuperCollider.
+    """
+
+    if backend is None:
+        backend = create_fitness_backend(shared=True)
+
+    return evaluate_genome_fitness(
+        genome=genome,
+        backend=backend,
+        target_audio_path=DEFAULT_TARGET_PATH,
+        candidate_output_dir=DEFAULT_CANDIDATE_DIR,
+        duration=4.0,
+    )
 
 
-def get_fitness(genome: Genome, timeout: float = 120.0) -> float:
+def get_fitness(
+    genome: Genome,
+    timeout: float = 120.0,
+    backend: Optional[Backend] = None,
+) -> float:
     """Convenience function for fitness evaluation with default settings.
 
     This wraps the core implementation in a Unix SIGALRM-based timeout so that
@@ -526,6 +848,13 @@ def get_fitness(genome: Genome, timeout: float = 120.0) -> float:
         The genome to evaluate.
     timeout:
         Maximum wall-clock time in seconds allowed for a single evaluation.
+    backend:
+        Running backend to render with, e.g. from
+        :func:`create_fitness_backend`. If ``None``, the process-wide shared
+        fitness backend is used, booted on the first call and kept running
+        until exit; pass an explicit one with
+        ``functools.partial(get_fitness, backend=...)`` to control its
+        lifetime.
 
     Returns
     -------
@@ -535,7 +864,7 @@ def get_fitness(genome: Genome, timeout: float = 120.0) -> float:
 
     # If SIGALRM is not available (e.g. on Windows), run without timeout guard.
     if not hasattr(signal, "SIGALRM"):
-        return _get_fitness_impl(genome)
+        return _get_fitness_impl(genome, backend)
 
     # Install a temporary alarm handler.
     previous_handler = signal.getsignal(signal.SIGALRM)
@@ -545,7 +874,7 @@ def get_fitness(genome: Genome, timeout: float = 120.0) -> float:
     signal.alarm(int(timeout))
 
     try:
-        return _get_fitness_impl(genome)
+        return _get_fitness_impl(genome, backend)
     except FitnessTimeoutError as e:
         print(f"[Fitness] TIMEOUT: {e}. Returning fitness=0.0")
         return 0.0
@@ -553,3 +882,39 @@ def get_fitness(genome: Genome, timeout: float = 120.0) -> float:
         # Always cancel the alarm and restore the previous handler.
         signal.alarm(0)
         signal.signal(signal.SIGALRM, previous_handler)
+
+
+def get_fitness_batch(
+    genomes: Sequence[Genome],
+    timeout: float = 120.0,
+    backend: Optional[Backend] = None,
+) -> List[float]:
+    """Evaluate several genomes on one backend.
+
+    Structurally identical genomes (same :attr:`Genome.structural_hash`)
+    are rendered only once.
+
+    Parameters
+    ----------
+    genomes:
+        The genomes to evaluate.
+    timeout:
+        Maximum wall-clock time in seconds allowed for each evaluation.
+    backend:
+        Running backend to render with; see :func:`get_fitness`.
+
+    Returns
+    -------
+    List[float]
+        Fitness scores in [0, 1], in the order of ``genomes``.
+    """
+
+    if backend is None and genomes:
+        backend = create_fitness_backend(shared=True)
+
+    scores: Dict[int, float] = {}
+    for genome in genomes:
+        key = genome.structural_hash
+        if key not in scores:
+            scores[key] = get_fitness(genome, timeout=timeout, backend=backend)
+    return [scores[genome.structural_hash] for genome in genomes]
@@ -13,8 +13,11 @@ Public API:
 - ``mutate_pattern_tree(tree, ...)`` -> :class:`PatternTree`
 """
 
+import os
+import pickle
 import random
-from typing import Callable, List, Optional, Sequence
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Union
 
 from lark import Tree
 
@@ -27,7 +30,7 @@ from .mutations import (
     VALUE_MUTATIONS,
     MutationOp,
 )
-from .parser import parse_control_pattern
+from .parser import _parse_control_pattern, parse_control_pattern
 from .seeds import random_seed_pattern
 
 
@@ -39,7 +42,7 @@ from .seeds import random_seed_pattern
 def pattern_tree_from_string(text: str) -> PatternTree:
     """Parse a string and convert it into a :class:`PatternTree`."""
 
-    tree = parse_control_pattern(text)
+    tree = _parse_control_pattern(text)
     return PatternTree.from_lark_tree(tree)
 
 
@@ -120,6 +123,7 @@ def generate_expressions_mutational(
     target_size: Optional[tuple[int, int]] = None,
     target_depth: Optional[tuple[int, int]] = None,
     rng: Optional[random.Random] = None,
+    cache_path: Optional[Union[str, Path]] = None,
 ) -> List[PatternTree]:
     """Generate ``n`` random patterns by seed-then-mutate over PatternTrees.
 
@@ -147,6 +151,11 @@ def generate_expressions_mutational(
     rng:
         Optional :class:`random.Random` instance to control randomness. If
         omitted, the module-level :mod:`random` is used.
+    cache_path:
+        Optional pickle file of previously generated trees. Trees stored
+        there are reused (first ``n``), only the shortfall is generated, and
+        the file is rewritten with the extended list. The file does not
+        record the generation settings, so use one path per configuration.
 
     Returns
     -------
@@ -154,6 +163,15 @@ def generate_expressions_mutational(
         A list of randomly generated pattern trees.
     """
 
+    results: List[PatternTree] = []
+    if cache_path is not None:
+        cache_path = Path(cache_path)
+        if cache_path.exists():
+            with open(cache_path, "rb") as f:
+                results = pickle.load(f)
+            if len(results) >= n:
+                return results[:n]
+
     if rng is None:
         rng = random
 
@@ -167,8 +185,6 @@ def generate_expressions_mutational(
     value_ops = VALUE_MUTATIONS
     shrink_ops = SHRINK_MUTATIONS
 
-    results: List[PatternTree] = []
-
     while len(results) < n:
         tree = random_seed_pattern(
             rng if isinstance(rng, random.Random) else random.Random()
@@ -176,8 +192,7 @@ def generate_expressions_mutational(
 
         steps = rng.randint(min_steps, max_steps)
         for _ in range(steps):
-            size = tree.size()
-            depth = tree.depth()
+            depth, size = tree.shape()
 
             too_small = size < target_size[0] or depth < target_depth[0]
             too_big = size > target_size[1] or depth > target_depth[1]
@@ -216,4 +231,17 @@ def generate_expressions_mutational(
 
         results.append(tree)
 
+    if cache_path is not None:
+        _save_trees(cache_path, results)
+
     return results
+
+
+def _save_trees(path: Path, trees: List[PatternTree]) -> None:
+    """Pickle ``trees`` to ``path`` via a temporary file and atomic rename."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    with open(temp_path, "wb") as f:
+        pickle.dump(trees, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
@@ -43,6 +43,17 @@ SCALE_NAME_POOL: list[str] = [
 ]
 
 
+def _alternatives(pool: list[str]) -> dict[str, tuple[str, ...]]:
+    """Map every value in ``pool`` to the other values, in pool order."""
+    return {value: tuple(v for v in pool if v != value) for value in pool}
+
+
+# Replacement candidates for each pooled value, so substituting a terminal
+# does not rescan its pool.
+SOUND_ALTERNATIVES = _alternatives(SOUND_POOL)
+SCALE_NAME_ALTERNATIVES = _alternatives(SCALE_NAME_POOL)
+
+
 # ---------------------------------------------------------------------------
 # Note / scale pattern generators
 # ---------------------------------------------------------------------------
@@ -15,7 +15,9 @@ from genetic_music.tree.pattern_tree import PatternTree
 from .common import (
     NOTE_PATTERN_GENERATOR,
     SCALE_INT_PATTERN_GENERATOR,
+    SCALE_NAME_ALTERNATIVES,
     SCALE_NAME_POOL,
+    SOUND_ALTERNATIVES,
     SOUND_POOL,
     clone_treenode,
 )
@@ -28,7 +30,12 @@ def terminal_substitution(tree: PatternTree, rng: random.Random) -> PatternTree:
     NOTE_PROB = 0.5
     SCALE_PROB = 0.5
 
-    def _choose_new_quoted(current: Any, pool: list[str], rng: random.Random) -> str:
+    def _choose_new_quoted(
+        current: Any,
+        pool: list[str],
+        alternatives: dict[str, tuple[str, ...]],
+        rng: random.Random,
+    ) -> str:
         if not isinstance(current, str):
             inner_current = None
         elif len(current) >= 2 and current[0] == '"' and current[-1] == '"':
@@ -36,8 +43,8 @@ def terminal_substitution(tree: PatternTree, rng: random.Random) -> PatternTree:
         else:
             inner_current = current
 
-        if len(pool) > 1 and inner_current in pool:
-            choices = [v for v in pool if v != inner_current]
+        if len(pool) > 1 and inner_current in alternatives:
+            choices = alternatives[inner_current]
         else:
             choices = pool
 
@@ -50,7 +57,9 @@ def terminal_substitution(tree: PatternTree, rng: random.Random) -> PatternTree:
         # Sounds: control__pattern_string_sample__SAMPLE_STRING
         if op == "control__pattern_string_sample__SAMPLE_STRING":
             if rng.random() < SOUND_PROB:
-                node.value = _choose_new_quoted(node.value, SOUND_POOL, rng)
+                node.value = _choose_new_quoted(
+                    node.value, SOUND_POOL, SOUND_ALTERNATIVES, rng
+                )
             return
 
         # Note patterns: control__STRING (used under cp_note_atom)
@@ -64,7 +73,9 @@ def terminal_substitution(tree: PatternTree, rng: random.Random) -> PatternTree:
         # Scale names: control__pattern_note__pattern_string_scale__SCALE_STRING
         if op == "control__pattern_note__pattern_string_scale__SCALE_STRING":
             if rng.random() < SCALE_PROB:
-                node.value = _choose_new_quoted(node.value, SCALE_NAME_POOL, rng)
+                node.value = _choose_new_quoted(
+                    node.value, SCALE_NAME_POOL, SCALE_NAME_ALTERNATIVES, rng
+                )
             return
 
         # Scale degree patterns: control__pattern_note__pattern_int__STRING
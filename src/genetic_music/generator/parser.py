@@ -6,9 +6,18 @@ This module owns the Lark parser instances used throughout the
 :mod:`genetic_music.generator` package.
 """
 
-from typing import Tuple
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from lark import Lark, Token, Tree
+from lark.exceptions import LarkError
+
+from genetic_music.grammar import MAIN_GRAMMAR_PATH
+
+try:
+    import lark_cython
+except ImportError:  # optional Cython LALR backend (``pip install .[cython]``)
+    lark_cython = None
 
 
 # ---------------------------------------------------------------------------
@@ -16,41 +25,115 @@ from lark import Lark, Token, Tree
 # ---------------------------------------------------------------------------
 
 
-def _build_parsers() -> Tuple[Lark, Lark]:
-    """Build the Earley (validation) and LALR (generation) parsers.
+def _build_gen_parser() -> Lark:
+    """Build the LALR (generation) parser.
 
-    The grammar is loaded from ``src/genetic_music/grammar/main.lark`` so
+    The grammar is loaded from ``genetic_music/grammar/main.lark``, found
+    next to the package rather than relative to the working directory, so
     that the grammar files live alongside the code without relying on
     package resource loading (which can interact poorly with Lark's
     ``%import`` resolution).
+
+    The compiled parse tables are cached on disk (``cache=True`` stores
+    them in the system temp directory, keyed by the grammar and options).
+    Lark re-checks the hashes of all imported grammar files on load, so
+    editing any ``.lark`` file invalidates the cache automatically.
+
+    When :mod:`lark_cython` is installed it is plugged into the LALR
+    parser, roughly halving lexing/parsing time. Its trees then hold
+    ``lark_cython`` tokens, which expose ``type``/``value`` but are not
+    :class:`lark.Token` instances; :func:`parse_control_pattern` converts
+    them back for callers outside this package.
     """
 
-    earley = Lark.open(
-        "src/genetic_music/grammar/main.lark",
-        start="control_pattern",  # playable by construction
-    )
-    gen = Lark.open(
-        "src/genetic_music/grammar/main.lark",
+    return Lark.open(
+        MAIN_GRAMMAR_PATH,
         start="control_pattern",  # playable by construction
         parser="lalr",
         lexer="contextual",
+        cache=True,
+        **({"_plugins": lark_cython.plugins} if lark_cython is not None else {}),
+    )
+
+
+def _build_earley_parser() -> Lark:
+    """Build the Earley (validation) parser.
+
+    Lark cannot cache Earley parsers and :mod:`lark_cython` does not
+    support them, so this is built on first use only.
+    """
+
+    return Lark.open(
+        MAIN_GRAMMAR_PATH,
+        start="control_pattern",  # playable by construction
     )
-    return earley, gen
 
 
-_EARLEY_PARSER, _GEN_PARSER = _build_parsers()
+_GEN_PARSER: Lark = _build_gen_parser()
+_EARLEY_PARSER: Optional[Lark] = None
+
+
+def _get_earley_parser() -> Lark:
+    """Return the Earley parser, building it on first call."""
+
+    global _EARLEY_PARSER
+    if _EARLEY_PARSER is None:
+        _EARLEY_PARSER = _build_earley_parser()
+    return _EARLEY_PARSER
 
 
 def get_parsers() -> Tuple[Lark, Lark]:
     """Return the cached (Earley, LALR) parser instances."""
 
-    return _EARLEY_PARSER, _GEN_PARSER
+    return _get_earley_parser(), _GEN_PARSER
+
+
+@lru_cache(maxsize=8192)
+def _parse_control_pattern(text: str) -> Tree:
+    """Parse ``text`` for internal use (see :func:`parse_control_pattern`).
+
+    With :mod:`lark_cython` installed, tokens of LALR-parsed trees are
+    ``lark_cython`` tokens; they are only read through ``type``/``value``
+    (e.g. by :meth:`PatternTree.from_lark_tree`).
+    """
+
+    try:
+        return _GEN_PARSER.parse(text)
+    except LarkError:
+        return _get_earley_parser().parse(text)
+
+
+def _to_lark_tokens(tree: Tree) -> Tree:
+    """Copy ``tree``, replacing ``lark_cython`` tokens with :class:`lark.Token`."""
+
+    children = []
+    for child in tree.children:
+        if isinstance(child, Tree):
+            child = _to_lark_tokens(child)
+        elif child is not None and not isinstance(child, Token):
+            child = Token.new_borrow_pos(child.type, child.value, child)
+        children.append(child)
+    return Tree(tree.data, children, tree._meta)
 
 
 def parse_control_pattern(text: str) -> Tree:
-    """Parse a textual control pattern into a Lark parse tree."""
+    """Parse a textual control pattern into a Lark parse tree.
+
+    The LALR parser is tried first as it is several times faster than
+    Earley; the Earley parser is only used when LALR rejects ``text``, so
+    anything the grammar accepts is still accepted.  Results are memoised
+    by ``text``: the returned tree may be shared between callers and must
+    be treated as read-only (e.g. convert it with
+    :meth:`PatternTree.from_lark_tree`, which copies it).
+
+    Leaves are always :class:`lark.Token` instances, whether or not the
+    optional :mod:`lark_cython` backend is installed.
+    """
 
-    return _EARLEY_PARSER.parse(text)
+    tree = _parse_control_pattern(text)
+    if lark_cython is None:
+        return tree
+    return _to_lark_tokens(tree)
 
 
 # ---------------------------------------------------------------------------
@@ -8,10 +8,12 @@ by mutation operators.
 """
 
 import random
+from functools import lru_cache
+from typing import Optional
 
 from genetic_music.tree.pattern_tree import PatternTree
 
-from .parser import parse_control_pattern
+from .parser import _parse_control_pattern
 from .mutations.common import SOUND_POOL, NOTE_PATTERN_GENERATOR
 
 
@@ -19,6 +21,25 @@ from .mutations.common import SOUND_POOL, NOTE_PATTERN_GENERATOR
 # Seed pattern generation
 # ---------------------------------------------------------------------------
 
+_FALLBACK_SEED_CODE = 's("bd")'
+
+
+@lru_cache(maxsize=4096)
+def _seed_tree(code: str) -> Optional[PatternTree]:
+    """Parse ``code`` straight into a :class:`PatternTree`, or ``None``.
+
+    Parsing and conversion happen in one step and the result is memoised
+    by ``code``: seeds are drawn from small value pools, so the same code
+    recurs often. Mutation operators never edit a ``PatternTree`` in place,
+    so the cached trees can safely be shared between individuals.
+    """
+
+    try:
+        return PatternTree.from_lark_tree(_parse_control_pattern(code))
+    except Exception:
+        return None
+
+
 
 def random_seed_pattern(rng: random.Random) -> PatternTree:
     """Generate a small, simple seed pattern as a :class:`PatternTree`.
@@ -45,11 +66,9 @@ def random_seed_pattern(rng: random.Random) -> PatternTree:
         inner = ",".join(f's("{s}")' for s in sounds)
         code = f"stack[{inner}]"
 
-    try:
-        tree = parse_control_pattern(code)
-        return PatternTree.from_lark_tree(tree)
-    except Exception:
+    tree = _seed_tree(code)
+    if tree is None:
         # Fallback: if parsing fails for any reason, fall back to a very
         # simple seed.
-        fallback_tree = parse_control_pattern('s("bd")')
-        return PatternTree.from_lark_tree(fallback_tree)
+        tree = _seed_tree(_FALLBACK_SEED_CODE)
+    return tree
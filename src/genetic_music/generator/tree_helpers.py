@@ -25,12 +25,15 @@ def iter_nodes_with_paths(
 
     results: List[tuple[List[int], TreeNode]] = []
 
-    def _walk(node: TreeNode, path: List[int]) -> None:
+    # Pre-order walk with an explicit stack; children are pushed in reverse
+    # so they are visited left to right.
+    stack = [(root, path_prefix)]
+    while stack:
+        node, path = stack.pop()
         results.append((path, node))
-        for idx, child in enumerate(node.children):
-            _walk(child, path + [idx])
+        for idx in range(len(node.children) - 1, -1, -1):
+            stack.append((node.children[idx], path + [idx]))
 
-    _walk(root, path_prefix)
     return results
 
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 This package provides the core evolutionary structures:
 - :class:`Genome` - Container for pattern trees with fitness and genetic operators
 - :func:`evolve_population` - Population-level selection and reproduction
+- :func:`evolve_islands` - Island-model evolution across processes
 
 Public API
 ----------
@@ -13,12 +14,14 @@ From :mod:`.genome`:
 
 From :mod:`.population`:
     - :func:`evolve_population` - Evolve a population for one generation
+    - :func:`evolve_islands` - Evolve sub-populations with ring migration
 """
 
 from .genome import Genome
-from .population import evolve_population
+from .population import evolve_islands, evolve_population
 
 __all__ = [
     "Genome",
+    "evolve_islands",
     "evolve_population",
 ]
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
-from typing import Sequence, Tuple
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence, Tuple
 
-from genetic_music.generator.generation import mutate_pattern_tree
+from genetic_music.generator.generation import (
+    generate_expressions_mutational,
+    mutate_pattern_tree,
+)
 from genetic_music.generator.tree_helpers import (
     iter_nodes_with_paths,
     clone_with_replacement,
@@ -16,10 +19,28 @@ from genetic_music.tree.pattern_tree import PatternTree
 
 @dataclass
 class Genome:
-    """Complete genome containing a pattern tree and its fitness score."""
+    """Complete genome containing a pattern tree and its fitness score.
+
+    ``evaluated`` records whether ``fitness`` holds a computed score, so that
+    a genuine score of ``0.0`` (e.g. a silent render) is not mistaken for an
+    unscored genome and evaluated again. A non-zero ``fitness`` passed to the
+    constructor implies ``evaluated``.
+    """
 
     pattern_tree: PatternTree
     fitness: float = 0.0
+    evaluated: bool = field(default=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.fitness != 0.0:
+            self.evaluated = True
+
+    def __setstate__(self, state: dict) -> None:
+        # ``__post_init__`` does not run on unpickling, and checkpoints
+        # written before ``evaluated`` existed do not store it: apply the
+        # same rule so scored genomes are not evaluated again on resume.
+        self.__dict__.update(state)
+        self.evaluated = state.get("evaluated", False) or self.fitness != 0.0
 
     @classmethod
     def random(cls, pattern_tree: PatternTree) -> "Genome":
@@ -31,6 +52,42 @@ class Genome:
         """
         return cls(pattern_tree=pattern_tree, fitness=0.0)
 
+    @classmethod
+    def random_batch(
+        cls,
+        n: int,
+        *,
+        rng: Optional[random.Random] = None,
+        **generation_kwargs: Any,
+    ) -> List["Genome"]:
+        """Create ``n`` unscored genomes with freshly generated pattern trees.
+
+        All trees are produced by a single
+        :func:`~genetic_music.generator.generation.generate_expressions_mutational`
+        call, which shares its setup and seed cache across the whole batch.
+        Extra keyword arguments (``min_steps``, ``target_size``, ...) are
+        forwarded to it.
+        """
+        trees = generate_expressions_mutational(n, rng=rng, **generation_kwargs)
+        return [cls(pattern_tree=tree, fitness=0.0) for tree in trees]
+
+    @property
+    def structural_hash(self) -> int:
+        """Hash of the underlying pattern structure.
+
+        See :meth:`PatternTree.structural_hash`; genomes with identical
+        trees share the same value and therefore the same fitness.
+        """
+        return self.pattern_tree.structural_hash()
+
+    def _copy(self) -> "Genome":
+        """Return a new genome sharing this tree and its score, if any."""
+        return Genome(
+            pattern_tree=self.pattern_tree,
+            fitness=self.fitness,
+            evaluated=self.evaluated,
+        )
+
     def mutate(
         self,
         rate: float = 1.0,
@@ -53,7 +110,7 @@ class Genome:
         """
         # Decide whether to mutate this genome at all.
         if random.random() > rate:
-            return Genome(pattern_tree=self.pattern_tree, fitness=self.fitness)
+            return self._copy()
 
         mutated_tree = mutate_pattern_tree(
             self.pattern_tree,
@@ -61,7 +118,7 @@ class Genome:
         )
         # If nothing changed, keep fitness; otherwise reset so it is recomputed.
         if mutated_tree is self.pattern_tree:
-            return Genome(pattern_tree=self.pattern_tree, fitness=self.fitness)
+            return self._copy()
 
         return Genome(pattern_tree=mutated_tree, fitness=0.0)
 
@@ -93,10 +150,7 @@ class Genome:
 
         if not common_ops:
             # No matching ops, return clones
-            return Genome(pattern_tree=self.pattern_tree, fitness=self.fitness), Genome(
-                pattern_tree=other.pattern_tree,
-                fitness=other.fitness,
-            )
+            return self._copy(), other._copy()
 
         # Randomly choose an op and one node from each tree
         chosen_op = random.choice(common_ops)
@@ -1,10 +1,121 @@
 """Population evolution and selection logic."""
 
+import multiprocessing as mp
+import os
+import queue
 import random
 import time
-from typing import List, Optional, Callable
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, List, MutableMapping, Optional, Sequence
+
+import numpy as np
+
 from .genome import Genome
 
+# Seconds between liveness checks of island processes while waiting for
+# their results.
+_ISLAND_POLL_INTERVAL = 1.0
+
+
+def _mp_context() -> mp.context.BaseContext:
+    """Multiprocessing context used for fitness workers and islands.
+
+    ``fork`` is preferred where available (Linux/macOS): workers inherit the
+    already-built Lark parsers, interned vocabularies and imported modules
+    copy-on-write instead of re-importing them. Elsewhere (Windows) the
+    platform default ``spawn`` is used; re-importing is then cheap thanks to
+    the on-disk LALR grammar cache.
+    """
+    if "fork" in mp.get_all_start_methods():
+        return mp.get_context("fork")
+    return mp.get_context()
+
+
+def _rank_by_fitness(genomes: List[Genome]) -> List[Genome]:
+    """Return ``genomes`` ordered by fitness, best first (stable)."""
+    fitness = np.fromiter(
+        (g.fitness for g in genomes), dtype=np.float64, count=len(genomes)
+    )
+    return [genomes[i] for i in np.argsort(-fitness, kind="stable")]
+
+
+def _evaluate_genomes(
+    genomes: List[Genome],
+    fitness_func: Callable[[Genome], float],
+    n_workers: int = 1,
+    fitness_cache: Optional[MutableMapping[int, float]] = None,
+    fitness_func_batch: Optional[
+        Callable[[List[Genome]], Sequence[float]]
+    ] = None,
+    executor: Optional[Executor] = None,
+) -> int:
+    """Score every genome that has not been evaluated yet.
+
+    Genomes carried over unchanged (elites, unmutated copies) keep their
+    score and are skipped.
+
+    If ``fitness_func_batch`` is given, all pending genomes are scored by a
+    single call to it. Otherwise, with an ``executor`` the pending genomes
+    are fanned out to its workers (master-slave model) in about four chunks
+    per worker (``n_workers``, or the CPU count if that is 1), and without
+    one they are evaluated in order on the calling process.
+    ``fitness_func`` and the genomes must be picklable for a process pool,
+    i.e. the function has to be defined at module level.
+
+    If ``fitness_cache`` is given, it maps :attr:`Genome.structural_hash` to
+    a previously computed score: cached genomes are not re-evaluated, and
+    structurally identical genomes in the batch are evaluated only once.
+
+    Returns:
+        Number of fitness function calls made
+    """
+    pending = [g for g in genomes if not g.evaluated]
+    if not pending:
+        return 0
+
+    if fitness_cache is None:
+        to_evaluate = pending
+    else:
+        unique: dict[int, Genome] = {}
+        for genome in pending:
+            key = genome.structural_hash
+            if key in fitness_cache:
+                genome.fitness = fitness_cache[key]
+                genome.evaluated = True
+            else:
+                unique.setdefault(key, genome)
+        to_evaluate = list(unique.values())
+
+    if fitness_func_batch is not None:
+        scores = list(fitness_func_batch(to_evaluate))
+    elif executor is not None and len(to_evaluate) > 1:
+        workers = n_workers if n_workers > 1 else (os.cpu_count() or 1)
+        scores = list(
+            executor.map(
+                fitness_func,
+                to_evaluate,
+                chunksize=max(1, len(to_evaluate) // (4 * workers)),
+            )
+        )
+    else:
+        scores = [fitness_func(genome) for genome in to_evaluate]
+
+    for genome, score in zip(to_evaluate, scores):
+        genome.fitness = score
+        genome.evaluated = True
+
+    if fitness_cache is not None:
+        for genome in to_evaluate:
+            fitness_cache[genome.structural_hash] = genome.fitness
+        # Duplicates of a genome evaluated above pick up its score.
+        for genome in pending:
+            if not genome.evaluated:
+                genome.fitness = fitness_cache[genome.structural_hash]
+                genome.evaluated = True
+
+    return len(to_evaluate)
+
 
 def evolve_population(
     population: List[Genome],
@@ -12,6 +123,12 @@ def evolve_population(
     mutation_rate: float = 0.1,
     elitism: int = 1,
     crossover_rate: float = 0.0,
+    n_workers: int = 1,
+    fitness_cache: Optional[MutableMapping[int, float]] = None,
+    fitness_func_batch: Optional[
+        Callable[[List[Genome]], Sequence[float]]
+    ] = None,
+    executor: Optional[Executor] = None,
 ) -> List[Genome]:
     """
     Evolve a population of genomes using mutation and selection.
@@ -24,17 +141,56 @@ def evolve_population(
         crossover_rate: Probability of generating offspring via crossover
             instead of single-parent mutation. If 0.0, evolution uses only
             mutation (current default behaviour).
+        n_workers: Number of worker processes used to evaluate fitness. With
+            the default of 1 every genome is evaluated sequentially on the
+            calling process, which is required when ``fitness_func`` drives a
+            shared resource such as the audio backend. Without ``executor``,
+            a process pool of this size is started for this call only.
+        fitness_cache: Optional mapping from :attr:`Genome.structural_hash`
+            to fitness, shared across generations by the caller. Genomes
+            whose structure has been scored before (e.g. unchanged elites or
+            offspring identical to an earlier individual) reuse the cached
+            score instead of calling ``fitness_func`` again.
+        fitness_func_batch: Optional function scoring a list of genomes at
+            once, returning one fitness per genome in order. When given it
+            replaces ``fitness_func`` and ``n_workers`` for evaluation and is
+            called once for the initial population and once for the
+            offspring of each generation, e.g. to map over a process pool
+            that is kept alive for the whole run.
+        executor: Optional executor (e.g. a ``ProcessPoolExecutor``) that
+            ``fitness_func`` is mapped over. Callers running many
+            generations should create one and pass it to every call, so
+            workers are started (and JIT kernels compiled) only once.
 
     Returns:
-        New population of evolved genomes
+        New population of evolved genomes, sorted by fitness (best first)
     """
-    # Evaluate fitness for all genomes
+    if executor is None and fitness_func_batch is None and n_workers > 1:
+        # One pool for both evaluation batches of this generation.
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=_mp_context()
+        ) as pool:
+            return evolve_population(
+                population,
+                fitness_func,
+                mutation_rate=mutation_rate,
+                elitism=elitism,
+                crossover_rate=crossover_rate,
+                n_workers=n_workers,
+                fitness_cache=fitness_cache,
+                executor=pool,
+            )
+
+    # Evaluate fitness for all genomes (only those not already scored)
     eval_start = time.time()
-    initial_evals = 0
-    for i, genome in enumerate(population):
-        if genome.fitness == 0.0:  # Only evaluate if not already scored
-            genome.fitness = fitness_func(genome)
-            initial_evals += 1
+    initial_evals = _evaluate_genomes(
+        population,
+        fitness_func,
+        n_workers,
+        fitness_cache,
+        fitness_func_batch,
+        executor,
+    )
     eval_time = time.time() - eval_start
 
     if initial_evals > 0:
@@ -43,7 +199,7 @@ def evolve_population(
         )
 
     # Sort by fitness (descending)
-    population.sort(key=lambda g: g.fitness, reverse=True)
+    population[:] = _rank_by_fitness(population)
 
     # Keep elite individuals
     new_population = population[:elitism]
@@ -55,10 +211,8 @@ def evolve_population(
         print(f"[Evolve] Creating {offspring_needed} offspring (elitism={elitism})...")
         offspring_start = time.time()
 
-        offspring_count = 0
-        while len(new_population) < len(population):
-            offspring_count += 1
-
+        offspring: List[Genome] = []
+        while len(new_population) + len(offspring) < len(population):
             use_crossover = (
                 crossover_rate > 0.0
                 and len(population) >= 2
@@ -75,17 +229,9 @@ def evolve_population(
                 child1, child2 = parent1.crossover(parent2)
 
                 # Optionally mutate children as well, controlled by mutation_rate.
-                child1 = child1.mutate(mutation_rate)
-                child2 = child2.mutate(mutation_rate)
-
-                if child1.fitness == 0.0:
-                    child1.fitness = fitness_func(child1)
-                new_population.append(child1)
-
-                if len(new_population) < len(population):
-                    if child2.fitness == 0.0:
-                        child2.fitness = fitness_func(child2)
-                    new_population.append(child2)
+                offspring.append(child1.mutate(mutation_rate))
+                if len(new_population) + len(offspring) < len(population):
+                    offspring.append(child2.mutate(mutation_rate))
 
             else:
                 # Select parent (bias towards fitter individuals)
@@ -93,20 +239,194 @@ def evolve_population(
                 parent = population[parent_idx]
 
                 # Create mutated offspring
-                offspring = parent.mutate(mutation_rate)
+                offspring.append(parent.mutate(mutation_rate))
 
-                if offspring.fitness == 0.0:
-                    offspring.fitness = fitness_func(offspring)
-
-                new_population.append(offspring)
+        # Score all new offspring in one batch so they can be evaluated in
+        # parallel when ``n_workers > 1`` or by ``fitness_func_batch``.
+        _evaluate_genomes(
+            offspring,
+            fitness_func,
+            n_workers,
+            fitness_cache,
+            fitness_func_batch,
+            executor,
+        )
+        new_population.extend(offspring)
 
         offspring_time = time.time() - offspring_start
         print(
             f"[Evolve] Offspring complete in {offspring_time:.2f}s (avg {offspring_time/offspring_needed:.2f}s/individual)"
         )
 
+    new_population = _rank_by_fitness(new_population)
+
     print(
         f"[Evolve] Best: {new_population[0].fitness:.4f}, Worst: {new_population[-1].fitness:.4f}"
     )
 
     return new_population
+
+
+def _run_island(
+    island_idx: int,
+    population: List[Genome],
+    fitness_func: Callable[[Genome], float],
+    generations: int,
+    migrate_every: int,
+    migrants: int,
+    inbox: "mp.Queue",
+    outbox: "mp.Queue",
+    results: "mp.Queue",
+    seed: Optional[int],
+    evolve_kwargs: dict,
+) -> None:
+    """Evolve one island, exchanging migrants with its ring neighbours.
+
+    Puts ``(island_idx, population, None)`` on ``results`` when done. On
+    failure it puts ``(island_idx, None, traceback)`` instead, and ``None``
+    on ``outbox`` so that the next island stops waiting for migrants and
+    fails in turn.
+    """
+    executor: Optional[Executor] = None
+    try:
+        # Forked islands inherit the parent's RNG state; reseed so they diverge.
+        random.seed(None if seed is None else seed + island_idx)
+
+        # Fitness workers of this island live for all its generations.
+        n_workers = evolve_kwargs.get("n_workers", 1)
+        if n_workers > 1 and evolve_kwargs.get("fitness_func_batch") is None:
+            executor = ProcessPoolExecutor(
+                max_workers=n_workers, mp_context=_mp_context()
+            )
+
+        for gen in range(1, generations + 1):
+            population = evolve_population(
+                population, fitness_func, executor=executor, **evolve_kwargs
+            )
+
+            if migrants > 0 and gen % migrate_every == 0 and gen < generations:
+                # ``population`` is sorted best-first by ``evolve_population``.
+                outbox.put(population[:migrants])
+                incoming: Optional[List[Genome]] = inbox.get()
+                if incoming is None:
+                    raise RuntimeError("the previous island in the ring failed")
+                # Migrants replace the worst individuals of this island.
+                population = population[: len(population) - len(incoming)] + incoming
+    except Exception:
+        results.put((island_idx, None, traceback.format_exc()))
+        outbox.put(None)
+        return
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    results.put((island_idx, population, None))
+
+
+def evolve_islands(
+    populations: List[List[Genome]],
+    fitness_func: Callable[[Genome], float],
+    generations: int,
+    migrate_every: int = 5,
+    migrants: int = 2,
+    seed: Optional[int] = None,
+    **evolve_kwargs: Any,
+) -> List[List[Genome]]:
+    """
+    Evolve several sub-populations in parallel using an island model.
+
+    Each island runs :func:`evolve_population` for ``generations``
+    generations in its own process. Every ``migrate_every`` generations each
+    island sends copies of its ``migrants`` best genomes to the next island
+    (ring topology), where they replace the worst individuals.
+
+    Args:
+        populations: One list of genomes per island
+        fitness_func: Function to evaluate genome fitness; must be picklable
+            (defined at module level)
+        generations: Number of generations to run on every island
+        migrate_every: Number of generations between migrations
+        migrants: Number of genomes sent to the next island per migration;
+            0 disables migration
+        seed: Optional base seed; island ``i`` is seeded with ``seed + i``
+        **evolve_kwargs: Forwarded to :func:`evolve_population`
+            (``mutation_rate``, ``elitism``, ``crossover_rate``, ...). With
+            ``n_workers > 1`` each island keeps one process pool of that
+            size for all its generations.
+
+    Returns:
+        The evolved populations, in the same order as ``populations``
+
+    Raises:
+        RuntimeError: If an island raises or its process dies (e.g. killed
+            by the OOM killer). The remaining islands are terminated.
+    """
+    if migrate_every < 1:
+        raise ValueError("migrate_every must be at least 1")
+    if "executor" in evolve_kwargs:
+        # Each island process starts its own pool from ``n_workers``.
+        raise ValueError("executor cannot be shared with island processes")
+
+    n_islands = len(populations)
+    ctx = _mp_context()
+    queues = [ctx.Queue() for _ in range(n_islands)]
+    results: "mp.Queue" = ctx.Queue()
+
+    processes = [
+        ctx.Process(
+            target=_run_island,
+            args=(
+                idx,
+                population,
+                fitness_func,
+                generations,
+                migrate_every,
+                migrants,
+                queues[idx],
+                queues[(idx + 1) % n_islands],
+                results,
+                seed,
+                evolve_kwargs,
+            ),
+        )
+        for idx, population in enumerate(populations)
+    ]
+    for process in processes:
+        process.start()
+
+    # Drain results before joining: a child blocks on exit until the data it
+    # put on a queue has been consumed. Waits are bounded so that an island
+    # that died without reporting is noticed instead of blocking forever.
+    evolved: List[List[Genome]] = [[] for _ in range(n_islands)]
+    pending = set(range(n_islands))
+    try:
+        while pending:
+            try:
+                idx, population, error = results.get(timeout=_ISLAND_POLL_INTERVAL)
+            except queue.Empty:
+                # Islands only exit cleanly after reporting, so a non-zero
+                # exit code means the result will never arrive.
+                for idx in pending:
+                    exitcode = processes[idx].exitcode
+                    if exitcode not in (None, 0):
+                        raise RuntimeError(
+                            f"Island {idx} died (exit code {exitcode}) "
+                            "before returning its population"
+                        )
+                continue
+            if error is not None:
+                raise RuntimeError(f"Island {idx} failed:\n{error}")
+            evolved[idx] = population
+            pending.discard(idx)
+    except BaseException:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+        raise
+
+    for process in processes:
+        process.join()
+
+    return evolved
@@ -0,0 +1,8 @@
+"""Lark grammar for TidalCycles control patterns."""
+
+from pathlib import Path
+
+# Entry point of the grammar. It is located next to this module rather than
+# relative to the working directory, and the other ``.lark`` files are found
+# through its relative ``%import`` statements.
+MAIN_GRAMMAR_PATH = str(Path(__file__).with_name("main.lark"))
@@ -5,10 +5,21 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Iterable, Optional
 
+import csv
 import json
 
 import numpy as np
-import pandas as pd
+
+CSV_COLUMNS = [
+    "generation",
+    "min_fitness",
+    "max_fitness",
+    "mean_fitness",
+    "std_fitness",
+    "best_fitness",
+    "population_size",
+    "best_expression",
+]
 
 
 @dataclass
@@ -38,6 +49,11 @@ class RunLoggerConfig:
 class RunLogger:
     """Minimal helper to log GA run statistics to CSV.
 
+    The CSV file is kept open for the lifetime of the logger and rows are
+    written in batches of ``flush_every`` generations, so the file is
+    updated in bursts; :meth:`close` (or leaving the ``with`` block) writes
+    any remaining rows. Use ``flush_every=1`` to write every generation.
+
     Usage
     -----
     >>> logger = RunLogger(run_name="long_run", metadata={"population_size": 128})
@@ -53,8 +69,11 @@ class RunLogger:
         output_dir: str | Path = "logs",
         overwrite: bool = False,
         metadata: Optional[dict[str, Any]] = None,
+        flush_every: int = 16,
     ) -> None:
         self._closed = False
+        self._flush_every = max(1, int(flush_every))
+        self._pending_rows: list[list[Any]] = []
 
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -96,16 +115,21 @@ class RunLogger:
         generation:
             Zero-based generation index.
         fitness_scores:
-            Iterable of fitness scores for the whole population.
+            Iterable of fitness scores for the whole population. A float
+            NumPy array is used as-is without copying.
         best_expression:
             String representation of the best individual (e.g. pretty-printed tree
-            or Tidal code). It will be stored as-is and quoted by pandas.
+            or Tidal code). It will be stored as-is and quoted by the CSV
+            writer.
         """
 
         if self._closed:
             raise RuntimeError("Cannot log_generation on a closed RunLogger.")
 
-        scores_array = np.fromiter(fitness_scores, dtype=float)
+        if isinstance(fitness_scores, np.ndarray):
+            scores_array = fitness_scores.astype(float, copy=False)
+        else:
+            scores_array = np.fromiter(fitness_scores, dtype=float)
         if scores_array.size == 0:
             raise ValueError("fitness_scores is empty; cannot compute statistics.")
 
@@ -114,34 +138,37 @@ class RunLogger:
         mean_f = float(scores_array.mean())
         std_f = float(scores_array.std(ddof=0))
 
-        row = {
-            "generation": int(generation),
-            "min_fitness": min_f,
-            "max_fitness": max_f,
-            "mean_fitness": mean_f,
-            "std_fitness": std_f,
-            "best_fitness": max_f,  # explicit, even if redundant
-            "population_size": int(scores_array.size),
-            "best_expression": best_expression,
-        }
+        # Values in ``CSV_COLUMNS`` order.
+        row = [
+            int(generation),
+            min_f,
+            max_f,
+            mean_f,
+            std_f,
+            max_f,  # best_fitness: explicit, even if redundant
+            int(scores_array.size),
+            best_expression,
+        ]
 
-        df = pd.DataFrame([row])
+        self._pending_rows.append(row)
+        if len(self._pending_rows) >= self._flush_every:
+            self.flush()
 
-        # Append without header (header is written once in _init_csv)
-        df.to_csv(
-            self.config.csv_path,
-            mode="a",
-            header=False,
-            index=False,
-        )
+    def flush(self) -> None:
+        """Write buffered rows to the CSV file."""
 
-    def close(self) -> None:
-        """Mark the logger as closed.
+        if self._pending_rows:
+            self._csv_writer.writerows(self._pending_rows)
+            self._pending_rows.clear()
+        self._csv_file.flush()
 
-        There are no persistent open file handles (pandas handles I/O per call),
-        but this is here for symmetry and future-proofing.
-        """
+    def close(self) -> None:
+        """Write any buffered rows and close the CSV file."""
 
+        if self._closed:
+            return
+        self.flush()
+        self._csv_file.close()
         self._closed = True
 
     # ------------------------------------------------------------------
@@ -173,21 +200,14 @@ class RunLogger:
         return obj
 
     def _init_csv(self) -> None:
-        """Create the CSV file with header only (no rows)."""
-
-        columns = [
-            "generation",
-            "min_fitness",
-            "max_fitness",
-            "mean_fitness",
-            "std_fitness",
-            "best_fitness",
-            "population_size",
-            "best_expression",
-        ]
+        """Create the CSV file with header only and keep it open for rows."""
 
-        df = pd.DataFrame(columns=columns)
-        df.to_csv(self.config.csv_path, index=False)
+        self._csv_file = self.config.csv_path.open(
+            "w", newline="", encoding="utf-8", buffering=65536
+        )
+        self._csv_writer = csv.writer(self._csv_file, lineterminator="\n")
+        self._csv_writer.writerow(CSV_COLUMNS)
+        self._csv_file.flush()
 
     def _write_metadata(self, metadata: dict[str, Any]) -> None:
         """Write a JSON sidecar file with run metadata.
@@ -1,5 +1,7 @@
 from .node import TreeNode
 from .pattern_tree import PatternTree
+from .vocab import intern_op, intern_sound
+from .flat import FlatTree, flatten, structural_stats
 from .pretty_print import (
     pretty_print,
     print_tree,
@@ -10,6 +12,11 @@ from .pretty_print import (
 __all__ = [
     "TreeNode",
     "PatternTree",
+    "intern_op",
+    "intern_sound",
+    "FlatTree",
+    "flatten",
+    "structural_stats",
     "pretty_print",
     "print_tree",
     "tree_summary",
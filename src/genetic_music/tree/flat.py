@@ -0,0 +1,161 @@
+"""Flat (structure-of-arrays) view of pattern trees.
+
+Structural fitness functions only need a few aggregate statistics of a tree
+(depth, size, number of distinct grammar rules and sample names).  Computing
+them by walking ``TreeNode`` objects costs several attribute lookups and a
+Python frame per node, so this module lowers a tree once into contiguous
+NumPy arrays and computes the statistics in a single pass over them.
+
+When `numba <https://numba.pydata.org>`_ is installed the pass is compiled to
+native code; otherwise an equivalent vectorised NumPy implementation is used.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple, Union
+
+import numpy as np
+
+from .node import TreeNode
+from .pattern_tree import PatternTree
+from .vocab import OP_TO_ID, SOUND_TO_ID, intern_sound
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional speed-up (``pip install .[jit]``)
+    njit = None
+
+
+# Leaves whose op contains this marker hold a concrete sample name such as
+# ``"bd"``, e.g. ``control__pattern_string_sample__SAMPLE_STRING``.
+SAMPLE_OP_MARKER = "SAMPLE_STRING"
+
+
+@dataclass(frozen=True)
+class FlatTree:
+    """Pre-order structure-of-arrays encoding of a ``TreeNode`` tree.
+
+    Attributes:
+        op_ids: ``TreeNode.op_id`` of every node (``int32[N]``).
+        sound_ids: Interned sample name of ``SAMPLE_STRING`` leaves, ``-1``
+            for every other node (``int32[N]``).
+        parent: Index of each node's parent, ``-1`` for the root (``int32[N]``).
+        depth: Depth of each node, the root having depth 1 (``int32[N]``).
+    """
+
+    op_ids: np.ndarray
+    sound_ids: np.ndarray
+    parent: np.ndarray
+    depth: np.ndarray
+
+    @property
+    def size(self) -> int:
+        """Total number of nodes."""
+        return int(self.op_ids.size)
+
+
+def flatten(tree: Union[PatternTree, TreeNode]) -> FlatTree:
+    """Lower ``tree`` into a :class:`FlatTree` in one pre-order walk."""
+    root = tree.root if isinstance(tree, PatternTree) else tree
+
+    op_ids: list[int] = []
+    sound_ids: list[int] = []
+    parent: list[int] = []
+    depth: list[int] = []
+
+    # Pre-order walk with an explicit stack; children are pushed in reverse
+    # so they are visited left to right. Bound methods and the marker are
+    # held in locals to avoid attribute/global lookups per node.
+    add_op, add_sound = op_ids.append, sound_ids.append
+    add_parent, add_depth = parent.append, depth.append
+    stack = [(root, -1, 1)]
+    push, pop = stack.append, stack.pop
+    marker = SAMPLE_OP_MARKER
+    idx = 0
+    while stack:
+        node, parent_idx, node_depth = pop()
+        add_op(node.op_id)
+        value = node.value
+        if value and marker in node.op:
+            add_sound(intern_sound(value.strip('"')))
+        else:
+            add_sound(-1)
+        add_parent(parent_idx)
+        add_depth(node_depth)
+        child_depth = node_depth + 1
+        for child in reversed(node.children):
+            push((child, idx, child_depth))
+        idx += 1
+
+    return FlatTree(
+        op_ids=np.asarray(op_ids, dtype=np.int32),
+        sound_ids=np.asarray(sound_ids, dtype=np.int32),
+        parent=np.asarray(parent, dtype=np.int32),
+        depth=np.asarray(depth, dtype=np.int32),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Statistics kernels
+# ---------------------------------------------------------------------------
+
+
+def _structural_counts_py(
+    op_ids: np.ndarray,
+    sound_ids: np.ndarray,
+    depth: np.ndarray,
+    n_op_ids: int,
+    n_sound_ids: int,
+) -> Tuple[int, int, int]:
+    """NumPy fallback for :func:`_structural_counts`."""
+    seen_ops = np.zeros(n_op_ids, dtype=np.bool_)
+    seen_ops[op_ids] = True
+    seen_sounds = np.zeros(n_sound_ids, dtype=np.bool_)
+    seen_sounds[sound_ids[sound_ids >= 0]] = True
+    return int(depth.max()), int(seen_ops.sum()), int(seen_sounds.sum())
+
+
+def _structural_counts_loop(op_ids, sound_ids, depth, n_op_ids, n_sound_ids):
+    """Single pass returning ``(max_depth, n_unique_ops, n_unique_sounds)``.
+
+    Uniqueness is tracked with boolean masks over the interned id space,
+    which Numba compiles to a tight loop with no hashing.
+    """
+    seen_ops = np.zeros(n_op_ids, dtype=np.bool_)
+    seen_sounds = np.zeros(n_sound_ids, dtype=np.bool_)
+    max_depth = 0
+    n_ops = 0
+    n_sounds = 0
+    for i in range(op_ids.shape[0]):
+        if depth[i] > max_depth:
+            max_depth = depth[i]
+        o = op_ids[i]
+        if not seen_ops[o]:
+            seen_ops[o] = True
+            n_ops += 1
+        s = sound_ids[i]
+        if s >= 0 and not seen_sounds[s]:
+            seen_sounds[s] = True
+            n_sounds += 1
+    return max_depth, n_ops, n_sounds
+
+
+if njit is not None:
+    # ``cache=True`` persists the compiled kernel next to this module so
+    # later runs skip compilation.
+    _structural_counts = njit(cache=True)(_structural_counts_loop)
+else:
+    _structural_counts = _structural_counts_py
+
+
+def structural_stats(flat: FlatTree) -> Tuple[int, int, int, int]:
+    """Return ``(depth, size, n_unique_ops, n_unique_sounds)`` for ``flat``."""
+    depth, n_ops, n_sounds = _structural_counts(
+        flat.op_ids,
+        flat.sound_ids,
+        flat.depth,
+        len(OP_TO_ID),
+        len(SOUND_TO_ID),
+    )
+    return int(depth), flat.size, int(n_ops), int(n_sounds)
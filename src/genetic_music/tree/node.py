@@ -1,30 +1,70 @@
 """Base TreeNode class for pattern trees."""
 
 # tidal_gen/tree/node.py
+import sys
 from dataclasses import dataclass, field
-from typing import Any, List
+from typing import Any, Dict, List, Tuple, Union
 
+from .vocab import intern_op
 
-@dataclass
+# Trees are built and walked in bulk, so nodes use ``__slots__`` (no
+# per-instance ``__dict__``) where dataclasses support it (Python 3.10+).
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class TreeNode:
     op: str
     children: List["TreeNode"] = field(default_factory=list)
     value: Any = None
+    # Interned id of ``op`` (see ``vocab.py``), used by flat/array kernels.
+    op_id: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.op_id = intern_op(self.op)
+
+    def __getstate__(self) -> Tuple[str, List["TreeNode"], Any]:
+        # Interned ids are process-local: drop them when pickling and
+        # re-intern on load (checkpoints, worker processes).
+        return self.op, self.children, self.value
+
+    def __setstate__(
+        self, state: Union[Tuple[str, List["TreeNode"], Any], Dict[str, Any]]
+    ) -> None:
+        # Checkpoints written before nodes had slots store a ``__dict__``.
+        if isinstance(state, dict):
+            state = state["op"], state["children"], state.get("value")
+        self.op, self.children, self.value = state
+        self.op_id = intern_op(self.op)
 
     def is_leaf(self) -> bool:
         return not self.children
 
     def depth(self) -> int:
         """Calculate tree depth."""
-        if self.is_leaf():
-            return 1
-        return 1 + max(child.depth() for child in self.children)
+        return self.shape()[0]
 
     def size(self) -> int:
         """Count total nodes in tree."""
-        if self.is_leaf():
-            return 1
-        return 1 + sum(child.size() for child in self.children)
+        return self.shape()[1]
+
+    def shape(self) -> Tuple[int, int]:
+        """Return ``(depth, size)`` computed in a single traversal.
+
+        Uses an explicit stack, so it is cheaper than calling ``depth()``
+        and ``size()`` separately and is not bounded by the recursion limit.
+        """
+        max_depth = 0
+        size = 0
+        stack = [(self, 1)]
+        while stack:
+            node, node_depth = stack.pop()
+            size += 1
+            if node_depth > max_depth:
+                max_depth = node_depth
+            for child in node.children:
+                stack.append((child, node_depth + 1))
+        return max_depth, size
 
     def __repr__(self) -> str:
         if self.is_leaf():
@@ -8,14 +8,18 @@ operators and structural analysis (depth, size, etc.).
 
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass
 from lark.lexer import Token
-from typing import Any, Iterable, Union
+from typing import TYPE_CHECKING, Any, Iterable, Union
 
 from lark import Lark, Tree, Token
 
 from .node import TreeNode
 
+if TYPE_CHECKING:
+    from .flat import FlatTree
+
 LarkNode = Union[Tree, Token]
 
 
@@ -25,7 +29,9 @@ def _lark_to_treenode(node: LarkNode) -> TreeNode:
     - Grammar rules (``Tree``) become internal nodes, with ``op`` set to the
       rule name (``Tree.data``) and children converted recursively.
     - Terminals (``Token``) become leaf nodes, with ``op`` set to the token
-      type and ``value`` to the token value.
+      type and ``value`` to the token value. Tokens produced by the
+      ``lark_cython`` backend are not ``lark.Token`` subclasses but expose
+      the same ``type``/``value`` attributes, so they are accepted too.
     """
     if isinstance(node, Tree):
         children = [
@@ -33,8 +39,10 @@ def _lark_to_treenode(node: LarkNode) -> TreeNode:
         ]
         return TreeNode(op=str(node.data), children=children)
 
-    if isinstance(node, Token):
-        return TreeNode(op=str(node.type), value=node.value)
+    if isinstance(node, Token) or (
+        hasattr(node, "type") and hasattr(node, "value")
+    ):
+        return TreeNode(op=str(node.type), value=str(node.value))
 
     raise TypeError(f"Unsupported Lark node type: {type(node)!r}")
 
@@ -44,9 +52,10 @@ class PatternTree:
     """Wrapper around a `TreeNode` root with helpers for Lark integration.
 
     The class is designed so that it behaves like the underlying ``TreeNode``:
-    attributes such as ``op``, ``children``, ``value``, and methods like
-    ``depth()`` and ``size()`` are transparently forwarded to the root node.
-    This keeps existing code that expects a node-like API working.
+    attributes such as ``op``, ``children`` and ``value`` are transparently
+    forwarded to the root node, and ``depth()``/``size()`` give the same
+    results as on the root (cached per tree). This keeps existing code that
+    expects a node-like API working.
     """
 
     root: TreeNode
@@ -70,19 +79,104 @@ class PatternTree:
     # ------------------------------------------------------------------
     def __getattr__(self, name: str) -> Any:
         """Delegate unknown attributes to the underlying root ``TreeNode``."""
+        # ``root`` and dunder lookups must not be forwarded: while unpickling,
+        # the instance exists before ``root`` is set, and forwarding would
+        # recurse forever (which also breaks sending genomes to worker
+        # processes).
+        if name == "root" or (name.startswith("__") and name.endswith("__")):
+            raise AttributeError(name)
         return getattr(self.root, name)
 
     def __repr__(self) -> str:
         return f"PatternTree({repr(self.root)})"
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PatternTree):
+            return NotImplemented
+        return self is other or self.structural_hash() == other.structural_hash()
+
+    def __hash__(self) -> int:
+        # Equal trees share a structural hash, so trees can key dicts and
+        # ``functools.lru_cache`` entries.
+        return self.structural_hash()
+
+    def __getstate__(self) -> dict:
+        # The flat view holds per-process interned ids (see ``vocab.py``), so
+        # it is rebuilt on demand after unpickling instead of being sent.
+        state = self.__dict__.copy()
+        state.pop("_flat", None)
+        return state
+
+    @property
+    def flat(self) -> "FlatTree":
+        """Structure-of-arrays view of the tree (see :mod:`.flat`).
+
+        Built on first access and cached; like :meth:`structural_hash`, this
+        relies on trees not being edited in place.
+        """
+        flat = self.__dict__.get("_flat")
+        if flat is None:
+            from .flat import flatten
+
+            flat = self._flat = flatten(self.root)
+        return flat
+
+    def structural_hash(self) -> int:
+        """Return a canonical hash of the tree's rules, tokens and leaf values.
+
+        The tree is serialised in pre-order as ``(op, value, n_children)``
+        records and digested with 128-bit BLAKE2b, so structurally identical
+        trees hash equally in every process and across runs. The value can
+        therefore key caches of pure functions of the tree (fitness, code
+        generation), including caches saved in checkpoints.
+
+        Mutation operators always build a new ``PatternTree`` instead of
+        editing one in place, so the hash is computed once and cached.
+        """
+        cached = self.__dict__.get("_structural_hash")
+        if cached is None:
+            parts = []
+            stack = [self.root]
+            while stack:
+                node = stack.pop()
+                parts.append(f"{node.op}\x1f{node.value!r}\x1f{len(node.children)}")
+                stack.extend(reversed(node.children))
+            digest = hashlib.blake2b(
+                "\x1e".join(parts).encode(), digest_size=16
+            ).digest()
+            cached = int.from_bytes(digest, "big")
+            self._structural_hash = cached
+        return cached
+
+    def shape(self) -> tuple[int, int]:
+        """Return ``(depth, size)`` of the tree (see :meth:`TreeNode.shape`).
+
+        Cached on first call, on the same no-in-place-edits assumption as
+        :meth:`structural_hash`.
+        """
+        cached = self.__dict__.get("_shape")
+        if cached is None:
+            cached = self._shape = self.root.shape()
+        return cached
+
+    def depth(self) -> int:
+        """Tree depth, cached (see :meth:`shape`)."""
+        return self.shape()[0]
+
+    def size(self) -> int:
+        """Total number of nodes, cached (see :meth:`shape`)."""
+        return self.shape()[1]
+
     # Simple iteration helpers, useful for generic traversals
     def iter_nodes(self) -> Iterable[TreeNode]:
-        """Depth-first traversal over all nodes in the tree."""
-
-        def _walk(node: TreeNode):
-            yield node
-            for child in node.children:
-                yield from _walk(child)
+        """Depth-first (pre-order) traversal over all nodes in the tree."""
+
+        def _walk(root: TreeNode):
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                yield node
+                stack.extend(reversed(node.children))
 
         return _walk(self.root)
 
@@ -4,6 +4,7 @@ This module provides functions to visualize TreeNode and PatternTree objects
 in a human-readable, hierarchical format using box-drawing characters.
 """
 
+from functools import lru_cache
 from typing import List
 from .node import TreeNode
 from .pattern_tree import PatternTree
@@ -30,9 +31,9 @@ def pretty_print(tree, show_types: bool = True, compact: bool = False) -> str:
         ├── note: c
         └── note: e
     """
-    # Handle PatternTree wrapper
+    # PatternTrees are hashable by structure, so their output is memoised
     if isinstance(tree, PatternTree):
-        tree = tree.root
+        return _pretty_print_pattern_tree(tree, show_types, compact)
     
     if not isinstance(tree, TreeNode):
         raise TypeError(f"Expected TreeNode or PatternTree, got {type(tree)}")
@@ -42,6 +43,14 @@ def pretty_print(tree, show_types: bool = True, compact: bool = False) -> str:
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=1024)
+def _pretty_print_pattern_tree(
+    tree: PatternTree, show_types: bool, compact: bool
+) -> str:
+    """Memoised :func:`pretty_print` for ``PatternTree`` inputs."""
+    return pretty_print(tree.root, show_types, compact)
+
+
 def _build_tree_lines(
     node: TreeNode,
     lines: List[str],
@@ -162,15 +171,14 @@ def tree_summary(tree) -> str:
     Returns:
         A string with tree statistics (depth, size, leaf count)
     """
-    # Handle PatternTree wrapper
+    # PatternTrees are hashable by structure, so their summary is memoised
     if isinstance(tree, PatternTree):
-        tree = tree.root
+        return _pattern_tree_summary(tree)
     
     if not isinstance(tree, TreeNode):
         raise TypeError(f"Expected TreeNode or PatternTree, got {type(tree)}")
     
-    depth = tree.depth()
-    size = tree.size()
+    depth, size = tree.shape()
     leaf_count = _count_leaves(tree)
     internal_count = size - leaf_count
     
@@ -183,11 +191,23 @@ def tree_summary(tree) -> str:
     )
 
 
+@lru_cache(maxsize=1024)
+def _pattern_tree_summary(tree: PatternTree) -> str:
+    """Memoised :func:`tree_summary` for ``PatternTree`` inputs."""
+    return tree_summary(tree.root)
+
+
 def _count_leaves(node: TreeNode) -> int:
     """Count the number of leaf nodes in a tree."""
-    if node.is_leaf():
-        return 1
-    return sum(_count_leaves(child) for child in node.children)
+    count = 0
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if current.is_leaf():
+            count += 1
+        else:
+            stack.extend(current.children)
+    return count
 
 
 def print_tree_with_summary(tree, show_types: bool = True, compact: bool = False) -> None:
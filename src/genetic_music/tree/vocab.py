@@ -0,0 +1,34 @@
+"""Interned vocabularies shared by all pattern trees.
+
+Grammar rule / token names (``TreeNode.op``) and sample names are mapped to
+small integer ids the first time they are seen.  Ids are dense, so sets of
+them can be represented as fixed-size boolean masks and compared without
+hashing strings.
+
+The tables are per-process and grow lazily: ids are only meaningful within
+the process that assigned them and must not be persisted or sent to other
+processes (``TreeNode`` re-interns its op when unpickled for this reason).
+"""
+
+from __future__ import annotations
+
+from typing import Dict
+
+OP_TO_ID: Dict[str, int] = {}
+SOUND_TO_ID: Dict[str, int] = {}
+
+
+def intern_op(op: str) -> int:
+    """Return the id of grammar op ``op``, assigning a new one if unseen."""
+    op_id = OP_TO_ID.get(op)
+    if op_id is None:
+        op_id = OP_TO_ID[op] = len(OP_TO_ID)
+    return op_id
+
+
+def intern_sound(sound: str) -> int:
+    """Return the id of sample name ``sound``, assigning a new one if unseen."""
+    sound_id = SOUND_TO_ID.get(sound)
+    if sound_id is None:
+        sound_id = SOUND_TO_ID[sound] = len(SOUND_TO_ID)
+    return sound_id
@@ -0,0 +1,40 @@
+"""Tests for audio file conversion in ``fitness_evaluation``."""
+
+import numpy as np
+import pytest
+
+sf = pytest.importorskip("soundfile")
+pytest.importorskip("librosa")
+
+from genetic_music.fitness_evaluation.fitness_evaluation import (  # noqa: E402
+    ensure_wav,
+)
+
+SR = 22050
+
+
+@pytest.fixture
+def tone() -> np.ndarray:
+    t = np.arange(SR) / SR
+    return (0.5 * np.sin(2 * np.pi * 440.0 * t)).astype(np.float64)
+
+
+@pytest.mark.parametrize(
+    "name, fmt, subtype, expected",
+    [
+        ("tone.flac", "FLAC", "PCM_24", "PCM_24"),
+        ("tone.flac", "FLAC", "PCM_16", "PCM_16"),
+        ("tone.aiff", "AIFF", "FLOAT", "FLOAT"),
+        ("tone.ogg", "OGG", "VORBIS", "FLOAT"),
+    ],
+)
+def test_ensure_wav_keeps_sample_format(tmp_path, tone, name, fmt, subtype, expected):
+    src = tmp_path / name
+    sf.write(src, tone, SR, format=fmt, subtype=subtype)
+
+    wav = ensure_wav(src)
+
+    assert wav.endswith(".wav")
+    assert sf.info(wav).subtype == expected
+    if subtype != "VORBIS":  # lossless sources convert sample-exactly
+        np.testing.assert_array_equal(sf.read(wav)[0], sf.read(src)[0])
@@ -0,0 +1,95 @@
+"""Tests for :mod:`genetic_music.checkpoint`."""
+
+import pickle
+import random
+import threading
+
+from genetic_music import checkpoint
+from genetic_music.checkpoint import CheckpointWriter, load_checkpoint, save_checkpoint
+from genetic_music.genome.genome import Genome
+from genetic_music.generator.generation import pattern_tree_from_string
+
+
+def _population():
+    return [
+        Genome(pattern_tree=pattern_tree_from_string('s("bd")'), fitness=0.5),
+        Genome(
+            pattern_tree=pattern_tree_from_string('slow 3(s("bd"))#note"1 3 4 7 11"')
+        ),
+    ]
+
+
+def test_save_and_load_round_trip(tmp_path):
+    population = _population()
+    random.seed(1)
+    save_checkpoint(tmp_path / "ckpt.pkl", 7, population, {"best": 0.5})
+    expected_next = random.random()
+
+    random.seed(2)
+    generation, loaded, extra = load_checkpoint(tmp_path / "ckpt.pkl")
+
+    assert generation == 7
+    assert extra == {"best": 0.5}
+    assert [g.pattern_tree for g in loaded] == [g.pattern_tree for g in population]
+    assert [g.fitness for g in loaded] == [0.5, 0.0]
+    assert [g.evaluated for g in loaded] == [True, False]
+    assert random.random() == expected_next
+    assert not (tmp_path / "ckpt.tmp").exists()
+
+
+def test_load_plain_pickle(tmp_path):
+    data = {
+        "generation": 3,
+        "population": _population(),
+        "rng_state": random.getstate(),
+    }
+    path = tmp_path / "old.pkl"
+    path.write_bytes(pickle.dumps(data, protocol=2))
+
+    generation, loaded, extra = load_checkpoint(path)
+
+    assert generation == 3
+    assert [g.pattern_tree for g in loaded] == [g.pattern_tree for g in _population()]
+    assert extra == {}
+
+
+def test_writer_drops_stale_checkpoints(tmp_path, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    written = []
+    write = checkpoint._write_checkpoint
+
+    def slow_write(filepath, payload):
+        started.set()
+        release.wait()
+        written.append(pickle.loads(payload)["generation"])
+        write(filepath, payload)
+
+    monkeypatch.setattr(checkpoint, "_write_checkpoint", slow_write)
+    population = _population()
+
+    with CheckpointWriter(tmp_path / "latest.pkl") as writer:
+        writer.save(1, population)
+        assert started.wait(5)
+        # The writer is busy with generation 1; only the newest of these
+        # should still be pending once it is done.
+        for generation in (2, 3, 4):
+            writer.save(generation, population)
+        release.set()
+
+    assert written == [1, 4]
+    assert load_checkpoint(tmp_path / "latest.pkl")[0] == 4
+
+
+def test_writer_surfaces_write_errors(tmp_path, monkeypatch):
+    def failing_write(filepath, payload):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(checkpoint, "_write_checkpoint", failing_write)
+    writer = CheckpointWriter(tmp_path / "latest.pkl")
+    writer.save(1, _population())
+    try:
+        writer.close()
+    except OSError as e:
+        assert "disk full" in str(e)
+    else:
+        raise AssertionError("close() did not raise the write error")
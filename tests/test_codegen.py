@@ -0,0 +1,36 @@
+"""Tests for :mod:`genetic_music.codegen.tidal_codegen`."""
+
+import random
+
+import pytest
+
+from genetic_music.codegen import tidal_codegen
+from genetic_music.codegen.tidal_codegen import to_tidal
+from genetic_music.genome.genome import Genome
+
+
+def _genomes(seed: int, n: int):
+    genomes = Genome.random_batch(n, rng=random.Random(seed))
+    random.seed(seed)
+    return genomes + [g.mutate() for g in genomes]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_matches_lark_reconstructor(seed):
+    for genome in _genomes(seed, 15):
+        tree = genome.pattern_tree
+        expected = tidal_codegen._RECONSTRUCTOR.reconstruct(tree.to_lark_tree())
+        assert to_tidal(tree) == expected
+
+
+def test_cached_layouts_are_reused():
+    tidal_codegen._LAYOUTS.clear()
+    genomes = _genomes(3, 10)
+    first = [to_tidal(g.pattern_tree) for g in genomes]
+    n_layouts = len(tidal_codegen._LAYOUTS)
+    assert n_layouts > 0
+
+    # Re-rendering from cached layouts gives the same code and adds none.
+    tidal_codegen._TIDAL_CODE_CACHE.clear()
+    assert [to_tidal(g.pattern_tree) for g in genomes] == first
+    assert len(tidal_codegen._LAYOUTS) == n_layouts
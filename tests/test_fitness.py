@@ -0,0 +1,80 @@
+"""Tests for fitness aggregation in ``fitness_evaluation``."""
+
+import pytest
+
+pytest.importorskip("librosa")
+pytest.importorskip("soundfile")
+
+from genetic_music.fitness_evaluation import fitness_evaluation as fe  # noqa: E402
+from genetic_music.genome.genome import Genome  # noqa: E402
+from genetic_music.generator.generation import (  # noqa: E402
+    pattern_tree_from_string,
+)
+
+
+@pytest.fixture
+def fake_features(monkeypatch):
+    """Replace audio loading and feature similarities with fixed values.
+
+    Returns the list of feature names in the order they were compared.
+    """
+    compared = []
+    values = {"mfcc": 0.9, "chroma": 0.1, "rhythm": 0.5, "tempo": 1.0}
+
+    def make_sim(name):
+        def sim(f1, f2):
+            compared.append(name)
+            return values[name]
+
+        return sim
+
+    monkeypatch.setattr(
+        fe, "_load_candidate", lambda audio1, audio2, sr: (None, sr, None)
+    )
+    monkeypatch.setattr(
+        fe, "_FEATURE_SIMILARITIES", {name: make_sim(name) for name in values}
+    )
+    monkeypatch.setattr(
+        fe, "feature_similarity", lambda a1, a2: {n: make_sim(n)(0, 0) for n in values}
+    )
+    return compared
+
+
+WEIGHTS = {"rhythm": 0.2, "mfcc": 0.4, "tempo": 0.1, "chroma": 0.3}
+
+
+def test_cutoff_compares_features_by_decreasing_weight(fake_features):
+    fitness, sims = fe.compute_fitness("c.wav", "t.wav", WEIGHTS, cutoff=-1.0)
+    assert fake_features == ["mfcc", "chroma", "rhythm", "tempo"]
+    full, _ = fe.compute_fitness("c.wav", "t.wav", WEIGHTS)
+    assert fitness == pytest.approx(full)
+    assert sims.keys() == set(WEIGHTS)
+
+
+def test_cutoff_stops_once_unreachable(fake_features):
+    # After mfcc (0.36) and chroma (0.03), at most 0.39 + 0.3 remains.
+    fitness, sims = fe.compute_fitness("c.wav", "t.wav", WEIGHTS, cutoff=0.7)
+    assert fake_features == ["mfcc", "chroma"]
+    assert list(sims) == ["mfcc", "chroma"]
+    assert fitness == pytest.approx(0.4 * 0.9 + 0.3 * 0.1)
+    assert fitness < 0.7
+
+
+def test_get_fitness_batch_renders_duplicates_once(monkeypatch):
+    calls = []
+
+    def fake_get_fitness(genome, timeout, backend):
+        calls.append(genome)
+        return genome.pattern_tree.size() / 100
+
+    monkeypatch.setattr(fe, "get_fitness", fake_get_fitness)
+    a = Genome(pattern_tree_from_string('s("bd")'))
+    a_copy = Genome(pattern_tree_from_string('s("bd")'))
+    b = Genome(pattern_tree_from_string('slow 3(s("bd"))#note"1 3 4 7 11"'))
+
+    scores = fe.get_fitness_batch([a, b, a_copy, b], backend=object())
+
+    assert len(calls) == 2
+    assert scores == [scores[0], scores[1], scores[0], scores[1]]
+    assert scores[0] == a.pattern_tree.size() / 100
+    assert scores[1] == b.pattern_tree.size() / 100
@@ -0,0 +1,195 @@
+"""Equivalence tests for the feature extraction in ``fitness_evaluation``.
+
+The lazily extracted features, and the similarities computed from them,
+must match the plain librosa calls of the original implementation, which is
+reproduced in :func:`_reference_similarity`.
+"""
+
+import numpy as np
+import pytest
+
+librosa = pytest.importorskip("librosa")
+sf = pytest.importorskip("soundfile")
+
+from librosa.feature.rhythm import tempo as tempo_fn  # noqa: E402
+
+from genetic_music.fitness_evaluation import fitness_evaluation as fe  # noqa: E402
+from genetic_music.fitness_evaluation.fitness_evaluation import (  # noqa: E402
+    _LazyFeatures,
+    compare_features,
+    compute_fitness,
+    compute_fitness_batch,
+    cosine_matrix_similarity,
+    cosine_similarity,
+    extract_features,
+)
+
+SR = 22050
+DURATION = 4.0
+
+
+def _signal(bpm: float, freq: float) -> np.ndarray:
+    """Clicks at ``bpm`` over a sine tone at ``freq`` Hz."""
+    n = int(DURATION * SR)
+    clicks = librosa.clicks(
+        times=np.arange(0.0, DURATION, 60.0 / bpm), sr=SR, length=n
+    )
+    tone = 0.3 * np.sin(2 * np.pi * freq * np.arange(n) / SR)
+    return (clicks + tone).astype(np.float32)
+
+
+@pytest.fixture(scope="module")
+def click_track() -> np.ndarray:
+    """Eight seconds of clicks at 120 BPM."""
+    return librosa.clicks(
+        times=np.arange(0.0, 8.0, 0.5), sr=SR, length=8 * SR
+    ).astype(np.float32)
+
+
+@pytest.fixture(scope="module")
+def target() -> np.ndarray:
+    return _signal(bpm=120.0, freq=440.0)
+
+
+@pytest.fixture(scope="module")
+def candidate() -> np.ndarray:
+    return _signal(bpm=100.0, freq=660.0)
+
+
+# ---------------------------------------------------------------------------
+# Original implementation
+# ---------------------------------------------------------------------------
+
+
+def _reference_matrix_similarity(M1, M2, eps=1e-10):
+    min_cols = min(M1.shape[1], M2.shape[1])
+    M1, M2 = M1[:, :min_cols], M2[:, :min_cols]
+    sims = [
+        cosine_similarity(M1[:, i], M2[:, i], eps)
+        for i in range(min_cols)
+        if not np.isnan(M1[:, i]).any() and not np.isnan(M2[:, i]).any()
+    ]
+    return float(np.mean(sims)) if sims else 0.0
+
+
+def _reference_similarity(y1, y2, sr):
+    min_len = min(len(y1), len(y2))
+    y1, y2 = y1[:min_len], y2[:min_len]
+    features = {}
+    features["mfcc"] = _reference_matrix_similarity(
+        librosa.feature.mfcc(y=y1, sr=sr, n_mfcc=13),
+        librosa.feature.mfcc(y=y2, sr=sr, n_mfcc=13),
+    )
+    S1, S2 = np.abs(librosa.stft(y1)) ** 2, np.abs(librosa.stft(y2)) ** 2
+    features["chroma"] = _reference_matrix_similarity(
+        librosa.feature.chroma_stft(S=S1, sr=sr),
+        librosa.feature.chroma_stft(S=S2, sr=sr),
+    )
+    features["rhythm"] = cosine_similarity(
+        librosa.onset.onset_strength(y=y1, sr=sr),
+        librosa.onset.onset_strength(y=y2, sr=sr),
+    )
+    mag1, mag2 = np.abs(np.fft.fft(y1)), np.abs(np.fft.fft(y2))
+    features["fft"] = float(np.clip(cosine_similarity(mag1, mag2), 0, 1))
+    features["rms"] = _reference_matrix_similarity(
+        librosa.feature.rms(y=y1), librosa.feature.rms(y=y2)
+    )
+    tempo1, tempo2 = tempo_fn(y=y1, sr=sr)[0], tempo_fn(y=y2, sr=sr)[0]
+    features["tempo"] = float(
+        np.clip(1 - abs(tempo1 - tempo2) / max(tempo1, tempo2), 0, 1)
+    )
+    return features
+
+
+# ---------------------------------------------------------------------------
+# Single features
+# ---------------------------------------------------------------------------
+
+
+def test_tempo_matches_librosa(click_track):
+    assert _LazyFeatures(click_track, SR).tempo == tempo_fn(y=click_track, sr=SR)[0]
+
+
+def test_onset_env_matches_librosa(click_track):
+    np.testing.assert_allclose(
+        _LazyFeatures(click_track, SR).onset_env,
+        librosa.onset.onset_strength(y=click_track, sr=SR),
+        rtol=1e-5,
+        atol=1e-5,
+    )
+
+
+def test_mfcc_matches_librosa(target):
+    np.testing.assert_allclose(
+        _LazyFeatures(target, SR).mfcc,
+        librosa.feature.mfcc(y=target, sr=SR, n_mfcc=13),
+        rtol=1e-4,
+        atol=1e-3,
+    )
+
+
+def test_chroma_matches_librosa(target):
+    S = np.abs(librosa.stft(target)) ** 2
+    np.testing.assert_allclose(
+        _LazyFeatures(target, SR).chroma,
+        librosa.feature.chroma_stft(S=S, sr=SR),
+        rtol=1e-5,
+        atol=1e-6,
+    )
+
+
+def test_cosine_matrix_similarity_matches_framewise_loop():
+    rng = np.random.default_rng(0)
+    M1, M2 = rng.normal(size=(13, 50)), rng.normal(size=(13, 60))
+    M1[:, 3] = np.nan  # skipped frame
+    M2[:, 7] = 0.0  # silent frame, counts as 0
+    assert cosine_matrix_similarity(M1, M2) == pytest.approx(
+        _reference_matrix_similarity(M1, M2), abs=1e-12
+    )
+
+
+def test_fft_magnitude_keeps_full_spectrum_similarity(target, candidate):
+    for n in (len(target), len(target) - 1):  # even and odd lengths
+        a, b = target[:n], candidate[:n]
+        full = cosine_similarity(np.abs(np.fft.fft(a)), np.abs(np.fft.fft(b)))
+        half = cosine_similarity(fe._fft_magnitude(a), fe._fft_magnitude(b))
+        assert half == pytest.approx(full, rel=1e-6)
+
+
+def test_pitch_tracks_the_tone_like_full_rate_yin(target):
+    # The 8 kHz contour has a different hop, so only the estimate is compared.
+    pitch = _LazyFeatures(target, SR).pitch
+    reference = librosa.yin(target, fmin=80, fmax=1000, sr=SR)
+    assert np.median(pitch) == pytest.approx(440.0, rel=0.02)
+    assert np.median(pitch) == pytest.approx(np.median(reference), rel=0.02)
+
+
+# ---------------------------------------------------------------------------
+# Similarities and fitness
+# ---------------------------------------------------------------------------
+
+
+def test_compare_features_matches_original_implementation(target, candidate):
+    expected = _reference_similarity(candidate, target, SR)
+    n = min(len(candidate), len(target))
+    sims = compare_features(
+        extract_features(candidate[:n], SR), extract_features(target[:n], SR)
+    )
+    for name, value in expected.items():
+        assert sims[name] == pytest.approx(value, rel=1e-5, abs=1e-6), name
+
+
+def test_compute_fitness_batch_matches_compute_fitness(tmp_path, target, candidate):
+    target_file = tmp_path / "target.wav"
+    sf.write(target_file, target, SR)
+    files = []
+    for i, y in enumerate([candidate, target, _signal(bpm=140.0, freq=330.0)]):
+        files.append(tmp_path / f"candidate_{i}.wav")
+        sf.write(files[-1], y, SR)
+
+    expected = [compute_fitness(f, target_file) for f in files]
+    batch = compute_fitness_batch(files, target_file, n_workers=2)
+
+    for (fitness, sims), (exp_fitness, exp_sims) in zip(batch, expected):
+        assert fitness == pytest.approx(exp_fitness)
+        assert sims == pytest.approx(exp_sims)
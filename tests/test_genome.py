@@ -0,0 +1,42 @@
+"""Tests for :class:`genetic_music.genome.genome.Genome`."""
+
+import pickle
+
+from genetic_music.genome.genome import Genome
+from genetic_music.tree.node import TreeNode
+from genetic_music.tree.pattern_tree import PatternTree
+
+
+def _genome(fitness: float) -> Genome:
+    root = TreeNode(op="sound", children=[TreeNode(op="STRING", value='"bd"')])
+    return Genome(pattern_tree=PatternTree(root=root), fitness=fitness)
+
+
+def _old_format_pickle(genome: Genome) -> bytes:
+    """Pickle ``genome`` as written before ``evaluated`` existed."""
+    state = genome.__dict__.copy()
+    state.pop("evaluated")
+    genome_old = Genome.__new__(Genome)
+    genome_old.__dict__.update(state)
+    data = pickle.dumps(genome_old)
+    assert b"evaluated" not in data
+    return data
+
+
+def test_old_pickle_with_fitness_is_evaluated():
+    genome = pickle.loads(_old_format_pickle(_genome(0.7)))
+    assert genome.fitness == 0.7
+    assert genome.evaluated
+
+
+def test_old_pickle_without_fitness_is_not_evaluated():
+    genome = pickle.loads(_old_format_pickle(_genome(0.0)))
+    assert not genome.evaluated
+
+
+def test_pickle_round_trip_keeps_evaluated_zero_score():
+    genome = _genome(0.0)
+    genome.evaluated = True
+    restored = pickle.loads(pickle.dumps(genome))
+    assert restored.evaluated
+    assert restored.pattern_tree == genome.pattern_tree
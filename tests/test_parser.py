@@ -0,0 +1,72 @@
+"""Tests for :mod:`genetic_music.generator.parser`."""
+
+from functools import lru_cache
+
+import pytest
+from lark import Lark, Token, Tree
+
+from genetic_music.generator import parser
+from genetic_music.grammar import MAIN_GRAMMAR_PATH
+from genetic_music.tree.pattern_tree import PatternTree
+
+CODES = [
+    's("bd")',
+    'slow 3(s("bd"))#note"1 3 4 7 11"',
+    'rev(euclid(3)(12)(append(rev(euclid(6)(12)(s("bd"))))((s("hh")#n"1 4 6 8 11"))))',
+    'striate(2)(((struct("f f t f t f t t f f f f")(((s("sn")#n"1 3 7")'
+    '#note"1 2 3"))#n"0 1 5 7 11")#n(scale"major""2 6 7")#s("hh")))',
+]
+
+
+@lru_cache(maxsize=None)
+def _lalr_parser(with_cython: bool = False) -> Lark:
+    plugins = {}
+    if with_cython:
+        plugins["_plugins"] = pytest.importorskip("lark_cython").plugins
+    return Lark.open(
+        MAIN_GRAMMAR_PATH,
+        start="control_pattern",
+        parser="lalr",
+        lexer="contextual",
+        cache=True,
+        **plugins,
+    )
+
+
+@pytest.fixture(params=["lark", "lark_cython"])
+def lalr_backend(request, monkeypatch):
+    """Run the parser module with the Cython plugin absent or present."""
+    if request.param == "lark":
+        monkeypatch.setattr(parser, "lark_cython", None)
+        monkeypatch.setattr(parser, "_GEN_PARSER", _lalr_parser())
+    else:
+        lark_cython = pytest.importorskip("lark_cython")
+        monkeypatch.setattr(parser, "lark_cython", lark_cython)
+        monkeypatch.setattr(parser, "_GEN_PARSER", _lalr_parser(with_cython=True))
+    parser._parse_control_pattern.cache_clear()
+    yield request.param
+    parser._parse_control_pattern.cache_clear()
+
+
+def _leaves(tree: Tree):
+    for child in tree.children:
+        if isinstance(child, Tree):
+            yield from _leaves(child)
+        elif child is not None:
+            yield child
+
+
+@pytest.mark.parametrize("code", CODES)
+def test_parse_control_pattern_returns_lark_tokens(lalr_backend, code):
+    tree = parser.parse_control_pattern(code)
+    leaves = list(_leaves(tree))
+    assert leaves
+    assert all(isinstance(leaf, Token) for leaf in leaves)
+    assert tree == _lalr_parser().parse(code)
+
+
+@pytest.mark.parametrize("code", CODES)
+def test_internal_parse_builds_same_pattern_tree(lalr_backend, code):
+    expected = PatternTree.from_lark_tree(_lalr_parser().parse(code))
+    assert PatternTree.from_lark_tree(parser._parse_control_pattern(code)) == expected
+    assert PatternTree.from_lark_tree(parser.parse_control_pattern(code)) == expected
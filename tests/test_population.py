@@ -0,0 +1,120 @@
+"""Tests for :mod:`genetic_music.genome.population`."""
+
+import multiprocessing as mp
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from genetic_music.genome import population as pop_mod
+from genetic_music.genome.genome import Genome
+from genetic_music.genome.population import evolve_islands, evolve_population
+
+needs_fork = pytest.mark.skipif(
+    "fork" not in mp.get_all_start_methods(),
+    reason="island tests set module state that only forked children inherit",
+)
+
+# Structural hashes for which the fitness functions below misbehave; set
+# before forking islands.
+_FAILING: set = set()
+
+
+def size_fitness(genome: Genome) -> float:
+    return genome.pattern_tree.size() / 1000
+
+
+def raising_fitness(genome: Genome) -> float:
+    if genome.structural_hash in _FAILING:
+        raise ValueError("fitness exploded")
+    return size_fitness(genome)
+
+
+def exiting_fitness(genome: Genome) -> float:
+    if genome.structural_hash in _FAILING:
+        os._exit(3)
+    return size_fitness(genome)
+
+
+def _population(n: int, seed: int) -> list:
+    return Genome.random_batch(n, rng=random.Random(seed))
+
+
+def test_executor_is_reused_across_generations(monkeypatch):
+    def no_new_pools(*args, **kwargs):
+        raise AssertionError("evolve_population started its own pool")
+
+    population = _population(8, seed=0)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        monkeypatch.setattr(pop_mod, "ProcessPoolExecutor", no_new_pools)
+        for _ in range(3):
+            population = evolve_population(
+                population, size_fitness, n_workers=2, executor=executor
+            )
+    assert all(g.evaluated for g in population)
+    assert all(g.fitness == size_fitness(g) for g in population)
+
+
+def test_n_workers_starts_one_pool_per_call(monkeypatch):
+    started = []
+
+    class CountingPool(ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            started.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(pop_mod, "ProcessPoolExecutor", CountingPool)
+    evolve_population(_population(8, seed=1), size_fitness, n_workers=2)
+    assert len(started) == 1
+
+
+@needs_fork
+def test_islands_migrate_best_genomes_around_the_ring():
+    populations = [_population(4, seed=10 + i) for i in range(3)]
+    # Rank each island as evolve_population will, before anything evolves.
+    best = []
+    for island in populations:
+        for genome in island:
+            genome.fitness, genome.evaluated = size_fitness(genome), True
+        best.append(pop_mod._rank_by_fitness(island)[0].structural_hash)
+
+    evolved = evolve_islands(
+        populations,
+        size_fitness,
+        generations=2,
+        migrate_every=1,
+        migrants=1,
+        elitism=4,  # no offspring: populations only change by migration
+    )
+
+    for idx, island in enumerate(evolved):
+        hashes = {g.structural_hash for g in island}
+        assert len(island) == 4
+        assert best[idx - 1] in hashes  # migrant from the previous island
+
+
+@needs_fork
+@pytest.mark.parametrize(
+    "fitness_func, message",
+    [
+        (raising_fitness, "fitness exploded"),
+        (exiting_fitness, "exit code 3"),
+    ],
+)
+def test_island_failure_is_raised_in_the_caller(fitness_func, message):
+    populations = [_population(4, seed=20 + i) for i in range(3)]
+    _FAILING.add(populations[1][0].structural_hash)
+    try:
+        with pytest.raises(RuntimeError, match="Island 1") as excinfo:
+            evolve_islands(
+                populations,
+                fitness_func,
+                generations=3,
+                migrate_every=1,
+                migrants=1,
+            )
+    finally:
+        _FAILING.clear()
+    assert message in str(excinfo.value)
+    assert not mp.active_children()
@@ -0,0 +1,51 @@
+"""Tests for pickling :class:`TreeNode` and :class:`PatternTree`."""
+
+import pickle
+
+import numpy as np
+
+from genetic_music.generator.generation import pattern_tree_from_string
+from genetic_music.tree.node import TreeNode
+from genetic_music.tree.vocab import intern_op
+
+CODE = 'slow 3(s("bd"))#note"1 3 4 7 11"'
+
+
+def _nodes(node):
+    yield node
+    for child in node.children:
+        yield from _nodes(child)
+
+
+def test_tree_node_round_trip():
+    root = pattern_tree_from_string(CODE).root
+    loaded = pickle.loads(pickle.dumps(root))
+
+    assert loaded == root
+    for node in _nodes(loaded):
+        assert node.op_id == intern_op(node.op)
+
+
+def test_tree_node_loads_dict_state():
+    # Nodes pickled before they had slots carry a ``__dict__`` state.
+    node = TreeNode.__new__(TreeNode)
+    node.__setstate__(
+        {"op": "sound", "children": [TreeNode(op="STRING", value='"bd"')]}
+    )
+
+    assert node == TreeNode(op="sound", children=[TreeNode(op="STRING", value='"bd"')])
+    assert node.value is None
+    assert node.op_id == intern_op("sound")
+
+
+def test_pattern_tree_round_trip_rebuilds_flat_view():
+    tree = pattern_tree_from_string(CODE)
+    flat = tree.flat
+    data = pickle.dumps(tree)
+    loaded = pickle.loads(data)
+
+    assert "_flat" not in loaded.__dict__
+    assert loaded == tree
+    assert loaded.structural_hash() == tree.structural_hash()
+    np.testing.assert_array_equal(loaded.flat.op_ids, flat.op_ids)
+    np.testing.assert_array_equal(loaded.flat.parent, flat.parent)